@@ -60,6 +60,8 @@ class BillsPage:
             on_scroll=self._on_banknotes_scroll,
         )
         self.tx_cards = ft.Column([], expand=True, spacing=8)
+        # 成功済みの採掘記録は不変なのでカードを再利用 (timestamp, block_index) -> card
+        self._block_card_cache = {}
         # その後で内容を更新
 
     def _format_lkc(self, amount: float) -> str:
@@ -75,6 +77,25 @@ class BillsPage:
         return f"{value:,.2f} LKC"
         
 
+    def _http(self):
+        """Keep-alive HTTP session shared with the node (own session as fallback)"""
+        session = getattr(getattr(self.app, "node", None), "_http_session", None)
+        if session is None:
+            session = getattr(self, "_http_session", None)
+            if session is None:
+                from utils import _build_requests_session
+                session = _build_requests_session()
+                self._http_session = session
+        return session
+
+    def _data_manager(self):
+        """Reuse the app's DataManager so its block index cache persists"""
+        manager = getattr(self.app, "data_manager", None)
+        if manager is None:
+            from utils import DataManager
+            manager = DataManager()
+        return manager
+
     def _get_block_for_index(self, block_index: int):
         """Fetch block using lunalib 1.9.2-compatible methods with API fallback."""
         if not self.app or not getattr(self.app, "node", None):
@@ -82,12 +103,9 @@ class BillsPage:
 
         # Check local submitted-block cache first
         try:
-            from utils import DataManager
-            cached_blocks = DataManager().load_blockchain_cache()
-            if isinstance(cached_blocks, list):
-                for block in cached_blocks:
-                    if isinstance(block, dict) and block.get("index") == block_index:
-                        return block
+            cached_block = self._data_manager().get_cached_block(block_index)
+            if cached_block:
+                return cached_block
         except Exception:
             pass
 
@@ -106,7 +124,7 @@ class BillsPage:
                         pass
 
         try:
-            import requests
+            session = self._http()
         except Exception:
             return None
 
@@ -125,7 +143,7 @@ class BillsPage:
 
         for url in endpoints:
             try:
-                response = requests.get(url, timeout=10)
+                response = session.get(url, timeout=10)
                 if response.status_code != 200:
                     continue
                 data = response.json()
@@ -153,14 +171,7 @@ class BillsPage:
 
         # Local cache first
         try:
-            from utils import DataManager
-            cached_blocks = DataManager().load_blockchain_cache()
-            if isinstance(cached_blocks, list):
-                for block in cached_blocks:
-                    if isinstance(block, dict):
-                        idx = block.get("index")
-                        if idx in unique_indices:
-                            results[idx] = block
+            results.update(self._data_manager().get_cached_blocks(unique_indices))
         except Exception:
             pass
 
@@ -211,21 +222,21 @@ class BillsPage:
 
         def _download():
             try:
-                import requests
                 import time
+                session = self._http()
                 cache_dir = self._get_thumbnail_cache_dir()
                 front_path = os.path.join(cache_dir, f"{tx_hash}_front_2x.png")
                 back_path = os.path.join(cache_dir, f"{tx_hash}_back_2x.png")
 
                 if not os.path.exists(front_path):
-                    resp = requests.get(front_url, timeout=15)
+                    resp = session.get(front_url, timeout=15)
                     if resp.ok:
                         with open(front_path, "wb") as f:
                             f.write(resp.content)
                     time.sleep(0.1)
 
                 if not os.path.exists(back_path):
-                    resp = requests.get(back_url, timeout=15)
+                    resp = session.get(back_url, timeout=15)
                     if resp.ok:
                         with open(back_path, "wb") as f:
                             f.write(resp.content)
@@ -272,7 +283,7 @@ class BillsPage:
         import json
         try:
             with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.bills_cache, f, ensure_ascii=False, indent=2)
+                json.dump(self.bills_cache, f, ensure_ascii=False, separators=(',', ':'))
         except Exception as e:
             print(f"[DEBUG] Failed to save bills cache: {e}")
 
@@ -514,8 +525,15 @@ class BillsPage:
             history_by_block.sort(key=lambda r: float(r.get('timestamp', 0) or 0), reverse=True)
         except Exception:
             pass
+        live_card_keys = set()
         for info in history_by_block:
             block_index = info.get('block_index')
+            card_key = (info.get('timestamp'), block_index)
+            live_card_keys.add(card_key)
+            cached_card = self._block_card_cache.get(card_key)
+            if cached_card is not None:
+                txs.append(cached_card)
+                continue
             block_hash = info.get('hash', '')
             nonce = info.get('nonce', '')
             mine_time = info.get('timestamp', 0)
@@ -593,16 +611,13 @@ class BillsPage:
                 margin=ft.Margin.only(bottom=4),
                 width=float('inf'),
             )
+            self._block_card_cache[card_key] = card
             txs.append(card)
-        self.tx_cards.controls = list(txs)
-        self.tx_cards.scroll = ft.ScrollMode.AUTO
-        if self.app.page:
-            self.app.page.update()
+        if len(self._block_card_cache) > len(live_card_keys):
+            self._block_card_cache = {k: v for k, v in self._block_card_cache.items() if k in live_card_keys}
         self.tx_cards.controls.clear()
         self.tx_cards.controls.extend(txs)
         self.tx_cards.scroll = ft.ScrollMode.AUTO
-        if self.app.page:
-            self.app.page.update()
         
         # Get mining rewards from history
         mining_history = self.app.node.get_mining_history()
@@ -649,7 +664,7 @@ class BillsPage:
                     self.update_bills_content(defer_scan=True)
 
                 if self.app and hasattr(self.app, "safe_run_thread"):
-                    ok = self.app.safe_run_thread(_apply)
+                    ok = self.app.safe_run_thread(_apply, key="bills")
                     if not ok:
                         self._scan_in_progress = False
                 else:
@@ -753,8 +768,7 @@ class BillsPage:
             self.bills_table
         ])
         
-        if self.app.page:
-            self.app.page.update()
+        self.app.safe_page_update()
 
     def get_bill_details(self, bill_hash: str):
         """Get detailed information about a specific bill"""
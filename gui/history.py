@@ -63,6 +63,5 @@ class MiningHistory:
             
             self.stats_content.controls.append(mined_blocks_panel)
 
-        if self.app.page:
-            self.app.page.update()
+        self.app.safe_page_update()
 
@@ -1,11 +1,25 @@
 import flet as ft
-from datetime import datetime
+import time
+from collections import deque
 from typing import List
 
 class LogPage:
+    _LOG_COLORS = {
+        "info": "#17a2b8",
+        "success": "#28a745",
+        "warning": "#ffc107",
+        "error": "#dc3545"
+    }
+
     def __init__(self, app):
         self.app = app
+        # 秒単位でタイムスタンプ文字列を使い回す
+        self._ts_sec = 0
+        self._ts_str = ""
         self.log_output = ft.Column(scroll=ft.ScrollMode.ALWAYS)
+        # 表示行のリングバッファ（ログタブ表示時だけcontrolsへ反映）
+        self._log_buffer = deque(maxlen=1000)
+        self._log_stale = False
         # ログファイル（logs.json）を読み込んで初期表示
         try:
             logs = self.app.data_manager.load_logs()
@@ -21,6 +35,8 @@ class LogPage:
 
     def create_log_tab(self):
         """Create log tab"""
+        self.log_output.controls = list(self._log_buffer)
+        self._log_stale = False
         clear_button = ft.Button(
             "Clear Log",
             on_click=lambda e: self.clear_log(),
@@ -65,33 +81,40 @@ class LogPage:
         except Exception:
             message = "[Invalid Unicode Character]"
 
-        color_map = {
-            "info": "#17a2b8",
-            "success": "#28a745", 
-            "warning": "#ffc107",
-            "error": "#dc3545"
-        }
-        
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        now_sec = int(time.time())
+        if now_sec != self._ts_sec:
+            self._ts_sec = now_sec
+            self._ts_str = time.strftime("%H:%M:%S", time.localtime(now_sec))
+        timestamp = self._ts_str
         log_entry = ft.Row([
             ft.Text(f"[{timestamp}]", size=10, color="#6c757d", width=70),
-            ft.Text(message, size=12, color=color_map.get(msg_type, "#e3f2fd"), expand=True)
+            ft.Text(message, size=12, color=self._LOG_COLORS.get(msg_type, "#e3f2fd"), expand=True)
         ], spacing=5)
         
-        self.log_output.controls.append(log_entry)
+        self._log_buffer.append(log_entry)
         
-        if len(self.log_output.controls) > 1000:
-            self.log_output.controls.pop(0)
-            
-        if self.app.page and self.app.current_tab_index == 3:
-            self.app.page.update()
+        if getattr(self.app, "current_tab_index", None) == 4:
+            self.log_output.controls = list(self._log_buffer)
+            self._log_stale = False
+            self.app.safe_page_update()
+        else:
+            self._log_stale = True
+
+    def show_log(self):
+        """Materialize buffered rows when the log tab becomes visible"""
+        if self._log_stale:
+            self.log_output.controls = list(self._log_buffer)
+            self._log_stale = False
+            self.app.safe_page_update()
         
     def clear_log(self):
         """Clear log output"""
+        self._log_buffer.clear()
+        self._log_stale = False
         self.log_output.controls.clear()
         try:
             if self.app and hasattr(self.app, "node") and self.app.node:
-                self.app.node.logs = []
+                self.app.node.logs.clear()
             if self.app and hasattr(self.app, "data_manager"):
                 self.app.data_manager.save_logs([])
         except Exception:
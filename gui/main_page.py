@@ -31,6 +31,8 @@ class MainPage:
         self.gpu_hashrate = 0.0
         self.mined_blocks = 0
         self.rejected_blocks = 0
+        # 統計タイルの値Text（初回だけ構築し、以降は値/色のみ更新）
+        self._stat_value_texts = None
         print(f"[DEBUG] __init__: stats_panel.content={self.stats_panel.content}")
 
     def _icon_label(self, icon_name: str, text: str, color: str = "#e3f2fd", icon_size: int = 16, text_size: int = 12):
@@ -158,7 +160,7 @@ class MainPage:
                 self.loading_ring.visible = True
             self.app.safe_page_update()
             return  # ここで必ずreturnし、status未定義で以降に進まない
-        status = self.app.node.get_status()
+        status = self.app.get_status_cached()
         if hasattr(self.app, "sidebar") and self.app.sidebar:
             try:
                 self.app.sidebar.update_status(status)
@@ -268,40 +270,16 @@ class MainPage:
             ("CPU Hashrate", f"{self._format_hash_rate(status.get('cpu_hash_rate', 0) or 0)}", "#00a1ff", 18),
             ("GPU Hashrate", f"{self._format_hash_rate(status.get('gpu_hash_rate', 0) or 0)}", "#00a1ff", 18),
         ]
-        table_rows = []
-        for i in range((len(stat_items) + 3) // 4):
-            row_cells = []
-            for j in range(4):
-                idx = i * 4 + j
-                if idx >= len(stat_items):
-                    break
-                label, value, color, value_size = stat_items[idx]
-                row_cells.append(
-                    ft.Container(
-                        content=ft.Column([
-                            ft.Text(label, size=13, color="#e3f2fd"),
-                            ft.Text(value, size=value_size, weight=ft.FontWeight.BOLD, color=color),
-                        ], alignment=ft.MainAxisAlignment.CENTER),
-                        padding=ft.padding.all(16),
-                        bgcolor="#1a2b3c",
-                        border_radius=1,
-                        # alignment指定を削除
-                        expand=True
-                    )
-                )
-            table_rows.append(ft.Row(row_cells, alignment=ft.MainAxisAlignment.CENTER, expand=True, spacing=18))
-        stats_table = ft.Column(table_rows, alignment=ft.MainAxisAlignment.CENTER, expand=True, spacing=18)
-        self.stats_panel.content = ft.Container(
-            content=stats_table,
-            padding=ft.padding.symmetric(vertical=16, horizontal=16),
-            bgcolor="#03111f",
-            border_radius=8,
-            expand=True,
-            shadow=ft.BoxShadow(blur_radius=16, color="#00000044", offset=ft.Offset(0, 4)),
-        )
+        if self._stat_value_texts is None:
+            self._build_stats_table(stat_items)
+        else:
+            for label, value, color, _value_size in stat_items:
+                value_text = self._stat_value_texts[label]
+                if value_text.value != value:
+                    value_text.value = value
+                if value_text.color != color:
+                    value_text.color = color
         self.stats_panel.visible = True
-        self.app.safe_page_update()
-        status = self.app.node.get_status()
         # 必要な統計値をセット
         self.cpu_hashrate = status.get('cpu_hash_rate', 0.0)
         self.gpu_hashrate = status.get('gpu_hash_rate', 0.0)
@@ -336,77 +314,45 @@ class MainPage:
             self.gpu_toggle_btn.disabled = not gpu_enabled
             self._set_button_label(self.cpu_toggle_btn, "cpu", "Stop CPU" if cpu_active else "Start CPU")
             self._set_button_label(self.gpu_toggle_btn, "monitor", "Stop GPU" if gpu_active else "Start GPU")
-        # Create detailed stats cards
-        stats_grid = ft.ResponsiveRow([
-            self._create_detailed_stat_card(
-                " Network Height", 
-                f"{status['network_height']}", 
-                "Current blockchain height",
-                "#00a1ff"
-            ),
-            self._create_detailed_stat_card(
-                "Network Difficulty", 
-                f"{status['network_difficulty']}", 
-                "Network's current difficulty",
-                "#17a2b8"
-            ),
-            self._create_detailed_stat_card(
-                "Mining Difficulty", 
-                f"{status.get('mining_difficulty', '--')}", 
-                "Your configured difficulty",
-                "#00e676"
-            ),
-            self._create_detailed_stat_card(
-                "Blocks Mined", 
-                f"{status['blocks_mined']}", 
-                "Total successful blocks",
-                "#28a745"
-            ),
-            self._create_detailed_stat_card(
-                "💰 Total Reward", 
-                self._format_lkc(status.get("total_reward", 0)),
-                "Accumulated mining rewards",
-                "#ffc107",
-                value_size=10
-            ),
-            self._create_detailed_stat_card(
-                "Current Hash Rate", 
-                f"{self._format_hash_rate(status['current_hash_rate'])}", 
-                "Real-time hashing speed",
-                "#00a1ff"
-            ),
-            self._create_detailed_stat_card(
-                "📈 Success Rate", 
-                f"{status['success_rate']:.1f}%", 
-                "Mining success percentage",
-                "#28a745" if status['success_rate'] > 50 else "#ffc107"
-            ),
-            self._create_detailed_stat_card(
-                "⏱️ Avg Mining Time", 
-                f"{status['avg_mining_time']:.2f}s", 
-                "Average block mining time",
-                "#17a2b8"
-            ),
-            self._create_detailed_stat_card(
-                "🕐 Uptime", 
-                f"{self._format_uptime(status['uptime'])}", 
-                "Node running time",
-                "#6c757d"
-            ),
-            self._create_detailed_stat_card(
-                "🔗 Connection", 
-                f"{status['connection_status'].title()}", 
-                "Network connection status",
-                "#28a745" if status['connection_status'] == 'connected' else "#dc3545"
-            ),
-            self._create_detailed_stat_card(
-                "📨 Mempool", 
-                f"{status['total_transactions']}", 
-                "Pending transactions",
-                "#6c757d"
-            ),
-        ])
-        # duplicate stats panel rendering removed to keep style consistent
+        # Push all control mutations above in one UI diff
+        self.app.safe_page_update()
+
+    def _build_stats_table(self, stat_items):
+        """Build the stat tiles once, keeping each value Text for in-place updates"""
+        self._stat_value_texts = {}
+        table_rows = []
+        for i in range((len(stat_items) + 3) // 4):
+            row_cells = []
+            for j in range(4):
+                idx = i * 4 + j
+                if idx >= len(stat_items):
+                    break
+                label, value, color, value_size = stat_items[idx]
+                value_text = ft.Text(value, size=value_size, weight=ft.FontWeight.BOLD, color=color)
+                self._stat_value_texts[label] = value_text
+                row_cells.append(
+                    ft.Container(
+                        content=ft.Column([
+                            ft.Text(label, size=13, color="#e3f2fd"),
+                            value_text,
+                        ], alignment=ft.MainAxisAlignment.CENTER),
+                        padding=ft.padding.all(16),
+                        bgcolor="#1a2b3c",
+                        border_radius=1,
+                        # alignment指定を削除
+                        expand=True
+                    )
+                )
+            table_rows.append(ft.Row(row_cells, alignment=ft.MainAxisAlignment.CENTER, expand=True, spacing=18))
+        stats_table = ft.Column(table_rows, alignment=ft.MainAxisAlignment.CENTER, expand=True, spacing=18)
+        self.stats_panel.content = ft.Container(
+            content=stats_table,
+            padding=ft.padding.symmetric(vertical=16, horizontal=16),
+            bgcolor="#03111f",
+            border_radius=8,
+            expand=True,
+            shadow=ft.BoxShadow(blur_radius=16, color="#00000044", offset=ft.Offset(0, 4)),
+        )
 
     def _create_detailed_stat_card(self, title: str, value: str, description: str, color: str, value_size: int = 18):
         """Create a detailed statistics card with description"""
@@ -430,12 +376,10 @@ class MainPage:
 
     def _format_hash_rate(self, hash_rate: float) -> str:
         """Format hash rate for display"""
-        if hash_rate > 1000000:
-            return f"{hash_rate/1000000:.2f} MH/s"
-        elif hash_rate > 1000:
-            return f"{hash_rate/1000:.2f} kH/s"
-        else:
-            return f"{hash_rate:.0f} H/s"
+        for divisor, unit in ((1000000, "MH/s"), (1000, "kH/s")):
+            if hash_rate > divisor:
+                return f"{hash_rate / divisor:.2f} {unit}"
+        return f"{hash_rate:.0f} H/s"
 
     def _format_lkc(self, amount: float) -> str:
         if lunalib_format_amount:
@@ -451,8 +395,8 @@ class MainPage:
 
     def _format_uptime(self, seconds: float) -> str:
         """Format uptime for display"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
+        hours, rem = divmod(int(seconds), 3600)
+        minutes = rem // 60
         
         if hours > 0:
             return f"{hours}h {minutes}m"
@@ -7,6 +7,8 @@ class SettingsPage:
     def __init__(self, app):
         self.app = app
         self.settings_content = ft.Column()
+        # Built once; later calls only sync control values from config
+        self._settings_grid = None
         print(f"[DEBUG] SettingsPage.__init__: app.node={getattr(app, 'node', None)}")
 
     def create_settings_tab(self):
@@ -35,6 +37,9 @@ class SettingsPage:
 
     def update_settings_content(self):
         """Modern card-based settings content, matching Stats UI style"""
+        if self._settings_grid is not None:
+            self._sync_settings_values()
+            return
         self.settings_content.controls.clear()
 
 
@@ -204,8 +209,38 @@ class SettingsPage:
             wallet_card,
         ], spacing=10)
         self.settings_content.controls.append(grid)
+        self._settings_grid = grid
         if self.app.page:
             self.app.page.update()
+
+    def _sync_settings_values(self):
+        """Refresh existing controls from config, touching only changed values"""
+        config = self.app.node.config if self.app.node else None
+        if not config:
+            return
+        perf_level = int(getattr(config, "performance_level", 70))
+        values = [
+            (self.auto_mining_switch, config.auto_mine),
+            (self.difficulty_field, str(config.difficulty)),
+            (self.performance_slider, perf_level),
+            (self.performance_value, f"Performance Balance: {perf_level}%"),
+            (self.gpu_switch, config.use_gpu),
+            (self.node_url_field, config.node_url),
+            (self.wallet_field, config.miner_address),
+            (self.sm3_workers_field, str(int(getattr(config, "sm3_workers", 0) or 0))),
+            (self.cuda_batch_field, str(int(getattr(config, "cuda_batch_size", 100000) or 100000))),
+            (self.gpu_batch_dynamic_check, bool(getattr(config, "gpu_batch_dynamic", False))),
+            (self.cpu_threads_field, str(int(getattr(config, "cpu_threads", 1) or 1))),
+            (self.multi_gpu_check, bool(getattr(config, "multi_gpu_enabled", False))),
+            (self.parallel_switch, bool(getattr(config, "parallel_mining", False))),
+        ]
+        changed = False
+        for control, value in values:
+            if control.value != value:
+                control.value = value
+                changed = True
+        if changed and self.app.page:
+            self.app.page.update()
     def _on_cpu_threads_changed(self, value):
         try:
             v = int(value)
@@ -215,7 +250,7 @@ class SettingsPage:
             v = 1
         if self.app.node:
             self.app.node.config.cpu_threads = v
-            self.app.node.config.save_to_storage()
+            self.app.node.request_config_save()
 
     def _create_mining_settings(self):
         """Create mining-related settings"""
@@ -661,19 +696,13 @@ class SettingsPage:
     def _on_sm3_workers_changed(self, value: str):
         if self.app.node and value.isdigit():
             self.app.node.config.sm3_workers = int(value)
-            try:
-                self.app.node.config.save_to_storage()
-            except Exception:
-                pass
+            self.app.node.request_config_save()
             self.app.add_log_message(f"SM3 workers set to {value}", "info")
 
     def _on_cuda_batch_changed(self, value: str):
         if self.app.node and value.isdigit():
             self.app.node.config.cuda_batch_size = int(value)
-            try:
-                self.app.node.config.save_to_storage()
-            except Exception:
-                pass
+            self.app.node.request_config_save()
             self.app.add_log_message(f"GPU batch set to {value}", "info")
 
     def _on_gpu_batch_dynamic_changed(self, value: bool):
@@ -809,9 +838,7 @@ class SettingsPage:
                 self.app.node.config.rewards_address = ""
             
             self.app.node.config.rewards_address = value.strip()
-            
-            if hasattr(self.app.node.config, 'save_to_storage'):
-                self.app.node.config.save_to_storage()
+            self.app.node.request_config_save()
             
             self.app.add_log_message(f"Rewards address updated: {value}", "success")
 
@@ -5,9 +5,15 @@ try:
 except Exception:
     lunalib_format_amount = None
 
+# (threshold/divisor, unit) for hash-rate display, largest first
+_HASH_RATE_UNITS = ((1000000, "MH/s"), (1000, "kH/s"))
+
 class Sidebar:
     def __init__(self, app):
         self.stats_update_timer = None
+        self._stats_stop_event = None
+        # 前回表示したstatus値（変化したラベルだけ更新する）
+        self._last_status = {}
         self.app = app
         self.lbl_node_status = ft.Text("Status: Initializing...", size=12, color="#e3f2fd")
         self.lbl_network_height = ft.Text("Network Height: --", size=10, color="#e3f2fd")
@@ -69,26 +75,42 @@ class Sidebar:
     
     def _start_stats_update_timer(self):
         # 既存タイマーがあれば停止
-        if self.stats_update_timer:
-            self.stats_update_timer.cancel()
+        self.stop_stats_update_timer()
         import threading
+        stop_event = threading.Event()
+        self._stats_stop_event = stop_event
+
+        def poll_interval():
+            # 採掘中は1秒、アイドル時は5秒
+            try:
+                if self.app.node and self.app.node.miner.is_mining:
+                    return 1.0
+            except Exception:
+                pass
+            return 5.0
+
         def update_loop():
-            while True:
-                import time
-                time.sleep(5)
+            while not stop_event.wait(poll_interval()):
                 if not getattr(self.app, "ui_active", True):
                     break
                 if hasattr(self.app, 'sidebar_tab_open') and not self.app.sidebar_tab_open:
                     break
+                if hasattr(self.app, "is_page_visible") and not self.app.is_page_visible():
+                    continue
                 self.update_stats_tab()
         self.stats_update_timer = threading.Thread(target=update_loop, daemon=True)
         self.stats_update_timer.start()
 
+    def stop_stats_update_timer(self):
+        """Wake and end the stats polling thread"""
+        if self._stats_stop_event:
+            self._stats_stop_event.set()
+
     def update_stats_tab(self):
         # 最新のノード統計値でmining_statsを更新
         if not hasattr(self.app, 'node') or not self.app.node:
             return
-        status = self.app.node.get_status()
+        status = self.app.get_status_cached()
         try:
             self.update_status(status)
         except Exception:
@@ -214,13 +236,20 @@ class Sidebar:
 
     def update_status(self, status: Dict):
         """Update sidebar status displays"""
-        self.lbl_node_status.value = f"Status: {'Running' if status['connection_status'] == 'connected' else 'Disconnected'}"
-        self.lbl_network_height.value = f"Network Height: {status['network_height']}"
-        self.lbl_difficulty.value = f"Network Difficulty: {status['network_difficulty']}"
-        self.lbl_mining_difficulty.value = f"Mining Difficulty: {status.get('mining_difficulty', '--')}"
-        self.lbl_blocks_mined.value = f"Blocks Mined: {status['blocks_mined']}"
-        self.lbl_total_reward.value = f"Total Reward: {self._format_lkc(status.get('total_reward', 0))}"
-        self.lbl_connection.value = f"Connection: {status['connection_status']}"
+        last = self._last_status
+        if status['connection_status'] != last.get('connection_status'):
+            self.lbl_node_status.value = f"Status: {'Running' if status['connection_status'] == 'connected' else 'Disconnected'}"
+            self.lbl_connection.value = f"Connection: {status['connection_status']}"
+        if status['network_height'] != last.get('network_height'):
+            self.lbl_network_height.value = f"Network Height: {status['network_height']}"
+        if status['network_difficulty'] != last.get('network_difficulty'):
+            self.lbl_difficulty.value = f"Network Difficulty: {status['network_difficulty']}"
+        if status.get('mining_difficulty', '--') != last.get('mining_difficulty'):
+            self.lbl_mining_difficulty.value = f"Mining Difficulty: {status.get('mining_difficulty', '--')}"
+        if status['blocks_mined'] != last.get('blocks_mined'):
+            self.lbl_blocks_mined.value = f"Blocks Mined: {status['blocks_mined']}"
+        if status.get('total_reward', 0) != last.get('total_reward'):
+            self.lbl_total_reward.value = f"Total Reward: {self._format_lkc(status.get('total_reward', 0))}"
         
         # Update P2P status
         p2p_connected = status.get('p2p_connected', False)
@@ -233,10 +262,8 @@ class Sidebar:
             self.lbl_p2p_status.color = "#ff5252"
 
         uptime_seconds = int(status['uptime'])
-        hours = uptime_seconds // 3600
-        minutes = (uptime_seconds % 3600) // 60
-        seconds = uptime_seconds % 60
-        self.lbl_uptime.value = f"Uptime: {hours:02d}:{minutes:02d}:{seconds:02d}"
+        if uptime_seconds != last.get('uptime_seconds'):
+            self.lbl_uptime.value = self._format_uptime(uptime_seconds)
 
         # Update mining stats
         cpu_rate = status.get('cpu_hash_rate', 0) or 0
@@ -256,12 +283,28 @@ class Sidebar:
             hash_algo = "sha256"
         self.lbl_hash_algo.value = f"Hash: {str(hash_algo).upper()}"
         
-        if hash_rate > 1000000:
-            self.lbl_hash_rate.value = f"Hash Rate: {hash_rate/1000000:.2f} MH/s"
-        elif hash_rate > 1000:
-            self.lbl_hash_rate.value = f"Hash Rate: {hash_rate/1000:.2f} kH/s"
-        else:
-            self.lbl_hash_rate.value = f"Hash Rate: {hash_rate:.0f} H/s"
+        self.lbl_hash_rate.value = f"Hash Rate: {self._format_hash_rate(hash_rate)}"
+        # Snapshot of what the labels now show; the next call skips unchanged fields
+        self._last_status = {
+            'connection_status': status['connection_status'],
+            'network_height': status['network_height'],
+            'network_difficulty': status['network_difficulty'],
+            'mining_difficulty': status.get('mining_difficulty', '--'),
+            'blocks_mined': status['blocks_mined'],
+            'total_reward': status.get('total_reward', 0),
+            'uptime_seconds': uptime_seconds,
+        }
+
+    def _format_hash_rate(self, hash_rate: float) -> str:
+        for divisor, unit in _HASH_RATE_UNITS:
+            if hash_rate > divisor:
+                return f"{hash_rate / divisor:.2f} {unit}"
+        return f"{hash_rate:.0f} H/s"
+
+    def _format_uptime(self, uptime_seconds: int) -> str:
+        minutes, seconds = divmod(uptime_seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"Uptime: {hours:02d}:{minutes:02d}:{seconds:02d}"
 
     def _format_lkc(self, amount: float) -> str:
         if lunalib_format_amount:
@@ -350,6 +393,8 @@ class Sidebar:
 
     def refresh_non_balance(self, status: Dict):
         """Refresh sidebar without balance-related fields."""
+        # Labels are rewritten here, so the next update_status() must not skip any
+        self._last_status = {}
         self.lbl_node_status.value = f"Status: {'Running' if status['connection_status'] == 'connected' else 'Disconnected'}"
         self.lbl_network_height.value = f"Network Height: {status['network_height']}"
         self.lbl_difficulty.value = f"Network Difficulty: {status['network_difficulty']}"
@@ -367,21 +412,13 @@ class Sidebar:
             self.lbl_p2p_status.color = "#ff5252"
 
         uptime_seconds = int(status['uptime'])
-        hours = uptime_seconds // 3600
-        minutes = (uptime_seconds % 3600) // 60
-        seconds = uptime_seconds % 60
-        self.lbl_uptime.value = f"Uptime: {hours:02d}:{minutes:02d}:{seconds:02d}"
+        self.lbl_uptime.value = self._format_uptime(uptime_seconds)
 
         cpu_rate = status.get('cpu_hash_rate', 0) or 0
         gpu_rate = status.get('gpu_hash_rate', 0) or 0
         hash_rate = cpu_rate + gpu_rate
         mining_method = status.get('mining_method', 'CPU')
-        if hash_rate > 1000000:
-            self.lbl_hash_rate.value = f"Hash Rate: {hash_rate/1000000:.2f} MH/s"
-        elif hash_rate > 1000:
-            self.lbl_hash_rate.value = f"Hash Rate: {hash_rate/1000:.2f} kH/s"
-        else:
-            self.lbl_hash_rate.value = f"Hash Rate: {hash_rate:.0f} H/s"
+        self.lbl_hash_rate.value = f"Hash Rate: {self._format_hash_rate(hash_rate)}"
 
         try:
             self.lbl_method_tags.controls.clear()
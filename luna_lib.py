@@ -11,6 +11,7 @@ import time
 import hashlib
 import secrets
 import threading
+import queue
 import requests
 import sqlite3
 import pickle
@@ -19,6 +20,7 @@ from cryptography.fernet import Fernet
 import base64
 from typing import Dict, List, Optional, Tuple, Set
 from dataclasses import dataclass
+from contextlib import contextmanager
 try:
     from gmssl.sm4 import CryptSM4, SM4_ENCRYPT, SM4_DECRYPT
     SM4_AVAILABLE = True
@@ -34,6 +36,64 @@ except ImportError:
     CUDA_AVAILABLE = False
     cp = None
 
+class SqlitePool:
+    """Fixed-size pool of SQLite connections shared across threads"""
+
+    _PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA cache_size=-32000",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA temp_store=MEMORY",
+    )
+
+    def __init__(self, path: str, size: Optional[int] = None):
+        if size is None:
+            try:
+                size = int(os.getenv("LUNALIB_SQLITE_POOL_SIZE", "5"))
+            except ValueError:
+                size = 5
+        self.path = path
+        self.size = max(1, size)
+        self._idle = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        # isolation_level=IMMEDIATE: writes take the lock at BEGIN instead of at first UPDATE
+        conn = sqlite3.connect(self.path, check_same_thread=False, timeout=10, isolation_level="IMMEDIATE")
+        for pragma in self._PRAGMAS:
+            try:
+                conn.execute(pragma)
+            except sqlite3.Error:
+                pass
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection; opens a new one until the pool is full, then waits"""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_open = self._created < self.size
+                if can_open:
+                    self._created += 1
+            if can_open:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            else:
+                conn = self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+
 class BlockchainCache:
     """Cache blockchain data locally to avoid redownloading"""
     
@@ -42,69 +102,61 @@ class BlockchainCache:
             cache_dir = SecureDataManager.get_data_dir()
         self.cache_dir = cache_dir
         self.cache_file = os.path.join(cache_dir, "blockchain_cache.db")
+        self._pool = SqlitePool(self.cache_file)
         self._init_cache()
     
     def _init_cache(self):
         """Initialize SQLite cache database"""
-        conn = sqlite3.connect(self.cache_file)
-        cursor = conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS blocks (
-                height INTEGER PRIMARY KEY,
-                hash TEXT UNIQUE,
-                block_data BLOB,
-                timestamp REAL,
-                last_accessed REAL
-            )
-        ''')
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS mempool (
-                tx_hash TEXT PRIMARY KEY,
-                tx_data BLOB,
-                received_time REAL,
-                address_involved TEXT
-            )
-        ''')
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS cache_meta (
-                key TEXT PRIMARY KEY,
-                value TEXT
-            )
-        ''')
-        conn.commit()
-        conn.close()
+        with self._pool.connection() as conn, conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS blocks (
+                    height INTEGER PRIMARY KEY,
+                    hash TEXT UNIQUE,
+                    block_data BLOB,
+                    timestamp REAL,
+                    last_accessed REAL
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS mempool (
+                    tx_hash TEXT PRIMARY KEY,
+                    tx_data BLOB,
+                    received_time REAL,
+                    address_involved TEXT
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS cache_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            ''')
     
     def save_block(self, height: int, block_hash: str, block_data: dict):
         """Save block to cache"""
         try:
-            conn = sqlite3.connect(self.cache_file)
-            cursor = conn.cursor()
             # Compress block data
             compressed_data = gzip.compress(pickle.dumps(block_data))
-            cursor.execute('''
-                INSERT OR REPLACE INTO blocks 
-                (height, hash, block_data, timestamp, last_accessed)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (height, block_hash, compressed_data, time.time(), time.time()))
-            conn.commit()
-            conn.close()
+            with self._pool.connection() as conn, conn:
+                conn.execute('''
+                    INSERT OR REPLACE INTO blocks 
+                    (height, hash, block_data, timestamp, last_accessed)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (height, block_hash, compressed_data, time.time(), time.time()))
         except Exception as e:
             print(f"Cache save error: {e}")
     
     def get_block(self, height: int) -> Optional[dict]:
         """Get block from cache"""
         try:
-            conn = sqlite3.connect(self.cache_file)
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT block_data FROM blocks WHERE height = ?
-            ''', (height,))
-            result = cursor.fetchone()
-            cursor.execute('''
-                UPDATE blocks SET last_accessed = ? WHERE height = ?
-            ''', (time.time(), height))
-            conn.commit()
-            conn.close()
+            with self._pool.connection() as conn, conn:
+                result = conn.execute('''
+                    SELECT block_data FROM blocks WHERE height = ?
+                ''', (height,)).fetchone()
+                conn.execute('''
+                    UPDATE blocks SET last_accessed = ? WHERE height = ?
+                ''', (time.time(), height))
             
             if result:
                 return pickle.loads(gzip.decompress(result[0]))
@@ -116,22 +168,21 @@ class BlockchainCache:
         """Get multiple blocks from cache"""
         blocks = []
         try:
-            conn = sqlite3.connect(self.cache_file)
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT height, block_data FROM blocks 
-                WHERE height BETWEEN ? AND ? 
-                ORDER BY height
-            ''', (start_height, end_height))
-            results = cursor.fetchall()
-            conn.close()
+            with self._pool.connection() as conn, conn:
+                results = conn.execute('''
+                    SELECT height, block_data FROM blocks 
+                    WHERE height BETWEEN ? AND ? 
+                    ORDER BY height
+                ''', (start_height, end_height)).fetchall()
+                # Update access time for the whole range in one statement
+                conn.execute('''
+                    UPDATE blocks SET last_accessed = ? WHERE height BETWEEN ? AND ?
+                ''', (time.time(), start_height, end_height))
             
             for height, block_data in results:
                 try:
                     block = pickle.loads(gzip.decompress(block_data))
                     blocks.append(block)
-                    # Update access time
-                    self.get_block(height)  # This updates last_accessed
                 except:
                     continue
                     
@@ -142,30 +193,43 @@ class BlockchainCache:
     def save_mempool_tx(self, tx_hash: str, tx_data: dict, address_involved: str = ""):
         """Save mempool transaction to cache"""
         try:
-            conn = sqlite3.connect(self.cache_file)
-            cursor = conn.cursor()
             compressed_data = gzip.compress(pickle.dumps(tx_data))
-            cursor.execute('''
-                INSERT OR REPLACE INTO mempool 
-                (tx_hash, tx_data, received_time, address_involved)
-                VALUES (?, ?, ?, ?)
-            ''', (tx_hash, compressed_data, time.time(), address_involved))
-            conn.commit()
-            conn.close()
+            with self._pool.connection() as conn, conn:
+                conn.execute('''
+                    INSERT OR REPLACE INTO mempool 
+                    (tx_hash, tx_data, received_time, address_involved)
+                    VALUES (?, ?, ?, ?)
+                ''', (tx_hash, compressed_data, time.time(), address_involved))
         except Exception as e:
             print(f"Mempool cache error: {e}")
-    
+
+    def save_mempool_txs_bulk(self, rows: List[Tuple[str, dict, str]]):
+        """Save many mempool transactions in a single commit"""
+        if not rows:
+            return
+        try:
+            now = time.time()
+            params = [
+                (tx_hash, gzip.compress(pickle.dumps(tx_data)), now, address_involved)
+                for tx_hash, tx_data, address_involved in rows
+            ]
+            with self._pool.connection() as conn, conn:
+                conn.executemany('''
+                    INSERT OR REPLACE INTO mempool
+                    (tx_hash, tx_data, received_time, address_involved)
+                    VALUES (?, ?, ?, ?)
+                ''', params)
+        except Exception as e:
+            print(f"Mempool cache error: {e}")
+
     def get_mempool_txs_for_address(self, address: str) -> List[dict]:
         """Get mempool transactions for specific address"""
         try:
-            conn = sqlite3.connect(self.cache_file)
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT tx_data FROM mempool 
-                WHERE address_involved = ? OR address_involved = ''
-            ''', (address.lower(),))
-            results = cursor.fetchall()
-            conn.close()
+            with self._pool.connection() as conn:
+                results = conn.execute('''
+                    SELECT tx_data FROM mempool 
+                    WHERE address_involved = ? OR address_involved = ''
+                ''', (address.lower(),)).fetchall()
             
             txs = []
             for result in results:
@@ -183,22 +247,16 @@ class BlockchainCache:
         """Clear mempool transactions older than specified hours"""
         try:
             cutoff = time.time() - (max_age_hours * 3600)
-            conn = sqlite3.connect(self.cache_file)
-            cursor = conn.cursor()
-            cursor.execute('DELETE FROM mempool WHERE received_time < ?', (cutoff,))
-            conn.commit()
-            conn.close()
+            with self._pool.connection() as conn, conn:
+                conn.execute('DELETE FROM mempool WHERE received_time < ?', (cutoff,))
         except Exception as e:
             print(f"Mempool cleanup error: {e}")
     
     def get_highest_cached_height(self) -> int:
         """Get the highest block height we have cached"""
         try:
-            conn = sqlite3.connect(self.cache_file)
-            cursor = conn.cursor()
-            cursor.execute('SELECT MAX(height) FROM blocks')
-            result = cursor.fetchone()
-            conn.close()
+            with self._pool.connection() as conn:
+                result = conn.execute('SELECT MAX(height) FROM blocks').fetchone()
             return result[0] if result[0] is not None else -1
         except:
             return -1
@@ -363,6 +421,23 @@ def setup_cuda():
         return False
 
 
+def _make_nonce_search(prefix: bytes, target_int: int):
+    """Build a nonce scanner with prefix midstate and target baked in"""
+    # Hash the prefix once; each attempt copies the state and feeds only the nonce
+    midstate = hashlib.sha256(prefix)
+
+    def run(start: int, count: int, copy=midstate.copy, from_bytes=int.from_bytes,
+            target=target_int) -> int:
+        for nonce in range(start, start + count):
+            h = copy()
+            h.update(str(nonce).encode())
+            if from_bytes(h.digest(), 'big') < target:
+                return nonce
+        return -1
+
+    return run
+
+
 class Block:
     """Block representation"""
     def __init__(self, index: int, previous_hash: str, timestamp: float, 
@@ -374,24 +449,44 @@ class Block:
         self.miner = miner
         self.difficulty = difficulty
         self.nonce = 0
+        self.hash_rate = 0.0
+        self._refresh_prefix()
         self.hash = self.calculate_hash()
+
+    def _refresh_prefix(self):
+        """Encode the nonce-independent part of the header once"""
+        self._prefix_bytes = f"{self.index}{self.previous_hash}{self.timestamp}{self.transactions}{self.miner}{self.difficulty}".encode()
         
     def calculate_hash(self) -> str:
         """Calculate block hash"""
-        block_data = f"{self.index}{self.previous_hash}{self.timestamp}{self.transactions}{self.miner}{self.difficulty}{self.nonce}"
-        return hashlib.sha256(block_data.encode()).hexdigest()
+        return hashlib.sha256(self._prefix_bytes + str(self.nonce).encode()).hexdigest()
     
     def mine_block(self) -> bool:
         """Mine the block (simplified - in real implementation this would use actual PoW)"""
-        target = "0" * self.difficulty
-        while not self.hash.startswith(target):
-            self.nonce += 1
-            self.hash = self.calculate_hash()
-            # Check for interruption every 1000 nonces
-            if self.nonce % 1000 == 0:
-                if hasattr(self, 'should_stop') and self.should_stop:
-                    return False
-        return True
+        self._refresh_prefix()
+        # "difficulty" leading hex zeros <=> digest value below 2^(256 - 4*difficulty)
+        target_int = 1 << max(0, 256 - 4 * self.difficulty)
+        search = _make_nonce_search(self._prefix_bytes, target_int)
+        nonce = self.nonce
+        last_ts = time.monotonic()
+        last_nonce = nonce
+        while True:
+            found = search(nonce, 4096)
+            if found >= 0:
+                self.nonce = found
+                self.hash = self.calculate_hash()
+                return True
+            nonce += 4096
+            # Sample rate / publish progress / check for interruption every 4096 nonces
+            now = time.monotonic()
+            if now - last_ts >= 1:
+                self.hash_rate = (nonce - last_nonce) / (now - last_ts)
+                last_ts = now
+                last_nonce = nonce
+            self.nonce = nonce
+            if getattr(self, 'should_stop', False):
+                self.hash = self.calculate_hash()
+                return False
     
     def to_dict(self) -> Dict:
         """Convert block to dictionary"""
@@ -479,6 +574,9 @@ class LunaLib:
 
         # Blockchain cache
         self.blockchain_cache = BlockchainCache()
+
+        # Shared keep-alive HTTP session (avoids a new TCP/TLS handshake per call)
+        self.session = requests.Session()
         
         # Network monitoring
         self.network_connected = False
@@ -501,13 +599,11 @@ class LunaLib:
     def _get_manual_block_count(self):
         """Manual fallback method to count blocks when height endpoint fails"""
         try:
-            import requests
-            
             print("DEBUG: Using manual block count method...")
             
             # Method 1: Try the blocks endpoint
             try:
-                response = requests.get('http://localhost:5555/blockchain/blocks', timeout=10)
+                response = self.session.get('http://localhost:5555/blockchain/blocks', timeout=10)
                 if response.status_code == 200:
                     data = response.json()
                     blocks = data.get('blocks', [])
@@ -519,7 +615,7 @@ class LunaLib:
             
             # Method 2: Try the range endpoint with a test range
             try:
-                response = requests.get('http://localhost:5555/blockchain/range?start=0&end=1000', timeout=10)
+                response = self.session.get('http://localhost:5555/blockchain/range?start=0&end=1000', timeout=10)
                 if response.status_code == 200:
                     data = response.json()
                     blocks = data.get('blocks', [])
@@ -535,7 +631,7 @@ class LunaLib:
                             # Try a higher range to find the actual end
                             for test_end in [5000, 10000, 50000]:
                                 try:
-                                    response = requests.get(f'http://localhost:5555/blockchain/range?start={test_end-100}&end={test_end}', timeout=5)
+                                    response = self.session.get(f'http://localhost:5555/blockchain/range?start={test_end-100}&end={test_end}', timeout=5)
                                     if response.status_code == 200:
                                         test_data = response.json()
                                         test_blocks = test_data.get('blocks', [])
@@ -555,7 +651,7 @@ class LunaLib:
             
             # Method 3: Try latest block endpoint
             try:
-                response = requests.get('http://localhost:5555/blockchain/latest-block', timeout=10)
+                response = self.session.get('http://localhost:5555/blockchain/latest-block', timeout=10)
                 if response.status_code == 200:
                     data = response.json()
                     block = data.get('block', {})
@@ -568,7 +664,7 @@ class LunaLib:
             
             # Method 4: Try system health endpoint
             try:
-                response = requests.get('http://localhost:5555/system/health', timeout=10)
+                response = self.session.get('http://localhost:5555/system/health', timeout=10)
                 if response.status_code == 200:
                     data = response.json()
                     blockchain_info = data.get('blockchain', {})
@@ -583,7 +679,7 @@ class LunaLib:
             print("DEBUG: Attempting incremental block probe...")
             for height in range(0, 10000, 100):  # Check every 100 blocks up to 10,000
                 try:
-                    response = requests.get(f'http://localhost:5555/blockchain/block/{height}', timeout=2)
+                    response = self.session.get(f'http://localhost:5555/blockchain/block/{height}', timeout=2)
                     if response.status_code != 200:
                         print(f"DEBUG: Block {height} not found, blockchain height is approximately {height-1}")
                         return max(0, height - 1)
@@ -844,7 +940,7 @@ class LunaLib:
     def check_network_connection(self) -> bool:
         """Check if we can connect to the network"""
         try:
-            response = requests.get("https://bank.linglin.art/health", timeout=5)
+            response = self.session.get("https://bank.linglin.art/health", timeout=5)
             self.network_connected = response.status_code == 200
             self.last_network_check = time.time()
             return self.network_connected
@@ -866,13 +962,13 @@ class LunaLib:
             
             # Get current blockchain height using optimized endpoint
             try:
-                response = requests.get("https://bank.linglin.art/blockchain/latest", timeout=10)
+                response = self.session.get("https://bank.linglin.art/blockchain/latest", timeout=10)
                 if response.status_code == 200:
                     latest_block = response.json()
                     current_height = latest_block.get('index', 0)
                 else:
                     # Fallback to full chain but only get length
-                    response = requests.get("https://bank.linglin.art/blockchain", timeout=30)
+                    response = self.session.get("https://bank.linglin.art/blockchain", timeout=30)
                     if response.status_code == 200:
                         blockchain = response.json()
                         current_height = len(blockchain) - 1 if blockchain else 0
@@ -891,7 +987,7 @@ class LunaLib:
                 return True
             
             # Determine what we need to download
-            cached_height = self.wallet_core.blockchain_cache.get_highest_cached_height()
+            cached_height = self.blockchain_cache.get_highest_cached_height()
             start_height = 0 if cached_height < 0 else cached_height + 1
             
             if start_height > current_height:
@@ -918,7 +1014,7 @@ class LunaLib:
                 
                 # Get blocks using range endpoint if available
                 try:
-                    response = requests.get(
+                    response = self.session.get(
                         f"https://bank.linglin.art/blockchain/range?start={batch_start}&end={batch_end}",
                         timeout=30
                     )
@@ -926,7 +1022,7 @@ class LunaLib:
                         blocks = response.json()
                     else:
                         # Fallback: get full chain and filter
-                        response = requests.get("https://bank.linglin.art/blockchain", timeout=60)
+                        response = self.session.get("https://bank.linglin.art/blockchain", timeout=60)
                         if response.status_code == 200:
                             full_chain = response.json()
                             blocks = [block for block in full_chain 
@@ -946,7 +1042,7 @@ class LunaLib:
                 for block in blocks:
                     height = block.get('index', batch_start)
                     block_hash = block.get('hash', '')
-                    self.wallet_core.blockchain_cache.save_block(height, block_hash, block)
+                    self.blockchain_cache.save_block(height, block_hash, block)
                 
                 # Small delay to be nice to the server
                 time.sleep(0.05)
@@ -967,7 +1063,7 @@ class LunaLib:
             if progress_callback:
                 progress_callback(0, "Loading mempool...")
             
-            response = requests.get("https://bank.linglin.art/mempool", timeout=15)
+            response = self.session.get("https://bank.linglin.art/mempool", timeout=15)
             if response.status_code == 200:
                 mempool = response.json()
                 if progress_callback:
@@ -984,14 +1080,6 @@ class LunaLib:
                 progress_callback(0, f"Error: {str(e)}")
             return []
 
-    def check_network_connection(self) -> bool:
-        """Check if we can connect to the network"""
-        try:
-            response = requests.get("https://bank.linglin.art/health", timeout=5)
-            return response.status_code == 200
-        except:
-            return False
-
     # Mempool Monitoring
     def start_mempool_monitoring(self):
         """Start monitoring mempool for incoming transactions"""
@@ -1043,7 +1131,7 @@ class LunaLib:
     def _get_mempool(self) -> List[dict]:
         """Get current mempool transactions"""
         try:
-            response = requests.get("https://bank.linglin.art/mempool", timeout=10)
+            response = self.session.get("https://bank.linglin.art/mempool", timeout=10)
             if response.status_code == 200:
                 return response.json()
         except Exception as e:
@@ -1054,46 +1142,52 @@ class LunaLib:
         """Process mempool transactions for our addresses - returns True if new transactions found"""
         new_txs_found = False
         
-        for tx in mempool_txs:
+        # Resolve sender/receiver once for the whole batch
+        froms = [(tx.get('from') or tx.get('sender') or '').lower() for tx in mempool_txs]
+        tos = [(tx.get('to') or tx.get('receiver') or '').lower() for tx in mempool_txs]
+        involved = [f if f in our_addresses else (t if t in our_addresses else '')
+                    for f, t in zip(froms, tos)]
+        pending_hashes = {ptx.get('hash') for ptx in self.pending_txs}
+        cache_rows = []
+
+        for tx, from_addr, to_addr, involved_address in zip(mempool_txs, froms, tos, involved):
+            if not involved_address:
+                continue
             tx_hash = tx.get('hash')
             if not tx_hash or tx_hash in self.watched_tx_hashes:
                 continue
             
-            # Check if this involves our addresses
-            from_addr = (tx.get('from') or tx.get('sender') or '').lower()
-            to_addr = (tx.get('to') or tx.get('receiver') or '').lower()
+            # This is our transaction - add to watched list
+            self.watched_tx_hashes.add(tx_hash)
             
-            if from_addr in our_addresses or to_addr in our_addresses:
-                # This is our transaction - add to watched list
-                self.watched_tx_hashes.add(tx_hash)
-                
-                # Cache the transaction
-                involved_address = from_addr if from_addr in our_addresses else to_addr
-                self.blockchain_cache.save_mempool_tx(tx_hash, tx, involved_address)
-                
-                # Add to pending transactions if it's outgoing
-                if from_addr in our_addresses and tx_hash not in [ptx.get('hash') for ptx in self.pending_txs]:
-                    self.pending_txs.append({
-                        "hash": tx_hash,
-                        "from": from_addr,
-                        "to": to_addr,
-                        "amount": float(tx.get('amount', 0)),
-                        "status": "pending",
-                        "timestamp": time.time(),
-                        "type": "transfer"
-                    })
+            # Queue the transaction for the batched cache write
+            cache_rows.append((tx_hash, tx, involved_address))
+            
+            # Add to pending transactions if it's outgoing
+            if from_addr in our_addresses and tx_hash not in pending_hashes:
+                pending_hashes.add(tx_hash)
+                self.pending_txs.append({
+                    "hash": tx_hash,
+                    "from": from_addr,
+                    "to": to_addr,
+                    "amount": float(tx.get('amount', 0)),
+                    "status": "pending",
+                    "timestamp": time.time(),
+                    "type": "transfer"
+                })
+                new_txs_found = True
+                print(f"DEBUG: New pending transaction detected: {tx_hash}")
+            
+            # Update wallet balances for pending state
+            for wallet in self.wallets:
+                if wallet['address'].lower() == from_addr:
+                    wallet['pending_send'] += float(tx.get('amount', 0))
                     new_txs_found = True
-                    print(f"DEBUG: New pending transaction detected: {tx_hash}")
-                
-                # Update wallet balances for pending state
-                for wallet in self.wallets:
-                    if wallet['address'].lower() == from_addr:
-                        wallet['pending_send'] += float(tx.get('amount', 0))
-                        new_txs_found = True
-                
-                if new_txs_found:
-                    self._trigger_callback(self.on_balance_changed)
-        
+            
+            if new_txs_found:
+                self._trigger_callback(self.on_balance_changed)
+
+        self.blockchain_cache.save_mempool_txs_bulk(cache_rows)
         return new_txs_found
 
     def scan_blockchain(self, force_full_scan=False, progress_callback=None):
@@ -1337,13 +1431,12 @@ class LunaLib:
         
         # Try to get blockchain via API
         try:
-            import requests
-            response = requests.get('http://localhost:5555/blockchain/height', timeout=5)
+            response = self.session.get('http://localhost:5555/blockchain/height', timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 print(f"API Blockchain height: {data.get('height')}")
             
-            response = requests.get('http://localhost:5555/blockchain/latest', timeout=5)
+            response = self.session.get('http://localhost:5555/blockchain/latest', timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 print(f"Latest block: {data.get('block')}")
@@ -1468,13 +1561,10 @@ class LunaLib:
         print("=== BLOCKCHAIN HEIGHT DEBUG ===")
         
         try:
-            import requests
-            import json
-            
             # Method 1: Direct API call to height endpoint
             print("1. Checking /blockchain/height endpoint...")
             try:
-                response = requests.get('http://localhost:5555/blockchain/height', timeout=10)
+                response = self.session.get('http://localhost:5555/blockchain/height', timeout=10)
                 print(f"   Status: {response.status_code}")
                 if response.status_code == 200:
                     data = response.json()
@@ -1490,7 +1580,7 @@ class LunaLib:
             # Method 2: Blocks endpoint to count blocks
             print("2. Checking /blockchain/blocks endpoint...")
             try:
-                response = requests.get('http://localhost:5555/blockchain/blocks', timeout=10)
+                response = self.session.get('http://localhost:5555/blockchain/blocks', timeout=10)
                 print(f"   Status: {response.status_code}")
                 if response.status_code == 200:
                     data = response.json()
@@ -1511,7 +1601,7 @@ class LunaLib:
             # Method 3: Latest block endpoint
             print("3. Checking /blockchain/latest-block endpoint...")
             try:
-                response = requests.get('http://localhost:5555/blockchain/latest-block', timeout=10)
+                response = self.session.get('http://localhost:5555/blockchain/latest-block', timeout=10)
                 print(f"   Status: {response.status_code}")
                 if response.status_code == 200:
                     data = response.json()
@@ -1530,7 +1620,7 @@ class LunaLib:
             print("4. Checking /blockchain/range endpoint...")
             try:
                 # Test a small range to see if it works
-                response = requests.get('http://localhost:5555/blockchain/range?start=0&end=5', timeout=10)
+                response = self.session.get('http://localhost:5555/blockchain/range?start=0&end=5', timeout=10)
                 print(f"   Status: {response.status_code}")
                 if response.status_code == 200:
                     data = response.json()
@@ -1546,7 +1636,7 @@ class LunaLib:
             # Method 5: Check blockchain viewer endpoint
             print("5. Checking /blockchain-viewer endpoint...")
             try:
-                response = requests.get('http://localhost:5555/blockchain-viewer', timeout=10)
+                response = self.session.get('http://localhost:5555/blockchain-viewer', timeout=10)
                 print(f"   Status: {response.status_code}")
                 if response.status_code == 200:
                     print("   Blockchain viewer is accessible")
@@ -1574,7 +1664,7 @@ class LunaLib:
             # Method 7: System health endpoint
             print("7. Checking /system/health endpoint...")
             try:
-                response = requests.get('http://localhost:5555/system/health', timeout=10)
+                response = self.session.get('http://localhost:5555/system/health', timeout=10)
                 print(f"   Status: {response.status_code}")
                 if response.status_code == 200:
                     data = response.json()
@@ -1619,8 +1709,6 @@ class LunaLib:
     def _get_blockchain_range_via_api(self, start_height, end_height):
         """Get a range of blocks via API calls with better error handling"""
         try:
-            import requests
-            
             # Validate range
             if start_height > end_height:
                 print(f"ERROR: Invalid range {start_height}-{end_height}")
@@ -1633,7 +1721,7 @@ class LunaLib:
             range_url = f'http://localhost:5555/blockchain/range?start={start_height}&end={end_height}'
             
             try:
-                response = requests.get(range_url, timeout=60)  # Increased timeout for large ranges
+                response = self.session.get(range_url, timeout=60)  # Increased timeout for large ranges
             except requests.exceptions.Timeout:
                 print(f"WARNING: API timeout for range {start_height}-{end_height}, trying smaller batch...")
                 # Fall back to smaller batches
@@ -1664,9 +1752,8 @@ class LunaLib:
             batch_end = min(batch_start + batch_size - 1, end_height)
             
             try:
-                import requests
                 range_url = f'http://localhost:5555/blockchain/range?start={batch_start}&end={batch_end}'
-                response = requests.get(range_url, timeout=30)
+                response = self.session.get(range_url, timeout=30)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -1688,10 +1775,8 @@ class LunaLib:
     def _get_blockchain_via_api(self):
         """Get blockchain data via API calls"""
         try:
-            import requests
-            
             # Get blockchain height first
-            height_response = requests.get('http://localhost:5555/blockchain/height', timeout=10)
+            height_response = self.session.get('http://localhost:5555/blockchain/height', timeout=10)
             if height_response.status_code != 200:
                 print("ERROR: Could not get blockchain height via API")
                 return []
@@ -1704,7 +1789,7 @@ class LunaLib:
                 return []
             
             # Get all blocks
-            blocks_response = requests.get('http://localhost:5555/blockchain/blocks', timeout=10)
+            blocks_response = self.session.get('http://localhost:5555/blockchain/blocks', timeout=10)
             if blocks_response.status_code == 200:
                 blocks_data = blocks_response.json()
                 return blocks_data.get('blocks', [])
@@ -1887,10 +1972,9 @@ class LunaLib:
         """Get current blockchain height from multiple sources"""
         try:
             # Try API first
-            import requests
             print("DEBUG: Attempting to get blockchain height via API...")
             
-            response = requests.get('http://localhost:5555/blockchain/height', timeout=10)
+            response = self.session.get('http://localhost:5555/blockchain/height', timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 height = data.get('height', 0)
@@ -1901,7 +1985,7 @@ class LunaLib:
                 print(f"DEBUG: API height request failed: {response.status_code} - {response.text}")
             
             # Try the blocks endpoint as fallback
-            response = requests.get('http://localhost:5555/blockchain/blocks', timeout=10)
+            response = self.session.get('http://localhost:5555/blockchain/blocks', timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 blocks = data.get('blocks', [])
@@ -1929,7 +2013,7 @@ class LunaLib:
         """Get specific block range - more efficient than full chain"""
         try:
             # Try range endpoint if available
-            response = requests.get(
+            response = self.session.get(
                 f"https://bank.linglin.art/blockchain/range?start={start_height}&end={end_height}",
                 timeout=30
             )
@@ -1952,7 +2036,7 @@ class LunaLib:
         """Get full blockchain data from network (fallback method)"""
         try:
             print("DEBUG: Fetching full blockchain data...")
-            response = requests.get("https://bank.linglin.art/blockchain", timeout=60)
+            response = self.session.get("https://bank.linglin.art/blockchain", timeout=60)
             if response.status_code == 200:
                 blockchain = response.json()
                 print(f"DEBUG: Received blockchain with {len(blockchain)} blocks")
@@ -2096,7 +2180,7 @@ class LunaLib:
         # Broadcast to mempool
         try:
             print(f"DEBUG: Broadcasting transaction to {to_address} for {amount} LKC")
-            response = requests.post("https://bank.linglin.art/mempool/add", json=tx, timeout=30)
+            response = self.session.post("https://bank.linglin.art/mempool/add", json=tx, timeout=30)
             if response.status_code == 201:
                 # Add to pending and watched list
                 self.pending_txs.append({
@@ -1,31 +1,51 @@
 import threading
+import queue
+import functools
+import heapq
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import time
 import os
-import json
-import shutil
-from datetime import datetime
-import base64
+import logging
 from typing import Dict, List, Optional, Tuple
-import sqlite3
 from pathlib import Path
 import certifi
-import PIL
 import sys
-# Force UTF-8 console to avoid charmap errors from emoji output
-os.environ.setdefault("PYTHONUTF8", "1")
-os.environ.setdefault("PYTHONIOENCODING", "utf-8")
-try:
-    if hasattr(sys.stdout, "reconfigure"):
-        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
-    if hasattr(sys.stderr, "reconfigure"):
-        sys.stderr.reconfigure(encoding="utf-8", errors="replace")
-except Exception:
-    pass
-# Lunalib backend selection (SM2). Use env override if provided.
-os.environ.setdefault("LUNALIB_SM2_BACKEND", "phos")
-os.environ.setdefault("LUNALIB_MINING_HASH_MODE", "compact")
-os.environ.setdefault("LUNALIB_BLOCK_REWARD_MODE", "linear")
-os.environ.setdefault("LUNALIB_CUDA_SM3", "1")
+_CA_BUNDLE = certifi.where()
+# All environment defaults are applied in one pass (_bootstrap_env) before any
+# thread exists: os.environ mutation is not safe against concurrent getenv.
+_ENV_DEFAULTS = {
+    # Force UTF-8 console to avoid charmap errors from emoji output
+    "PYTHONUTF8": "1",
+    "PYTHONIOENCODING": "utf-8",
+    # Lunalib backend selection (SM2). Use env override if provided.
+    "LUNALIB_SM2_BACKEND": "phos",
+    "LUNALIB_MINING_HASH_MODE": "compact",
+    "LUNALIB_BLOCK_REWARD_MODE": "linear",
+    "LUNALIB_CUDA_SM3": "1",
+    "REQUESTS_CA_BUNDLE": _CA_BUNDLE,
+    "SSL_CERT_FILE": _CA_BUNDLE,
+}
+# Extra defaults for packaged (frozen) builds
+_FROZEN_ENV_DEFAULTS = {
+    "LUNALIB_DISABLE_P2P": "1",
+    "LUNANODE_FAST_STARTUP": "1",
+    "LUNANODE_STARTUP_SYNC_DELAY": "30",
+    "LUNANODE_DISABLE_GPU_INIT": "0",
+}
+# Set once module-level env setup is done; thread-spawning code checks it
+_ENV_READY = False
+# Once per process: main.py and utils.py both run this, and reloads re-import
+if not getattr(sys, "_lunanode_utf8_ready", False):
+    try:
+        if hasattr(sys.stdout, "reconfigure"):
+            sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+        if hasattr(sys.stderr, "reconfigure"):
+            sys.stderr.reconfigure(encoding="utf-8", errors="replace")
+    except Exception:
+        pass
+    sys._lunanode_utf8_ready = True
 
 def _is_frozen_like() -> bool:
     try:
@@ -38,13 +58,18 @@ def _is_frozen_like() -> bool:
     except Exception:
         return False
 
-if _is_frozen_like():
-    os.environ.setdefault("LUNALIB_DISABLE_P2P", "1")
-    os.environ.setdefault("LUNANODE_FAST_STARTUP", "1")
-    os.environ.setdefault("LUNANODE_STARTUP_SYNC_DELAY", "30")
-    os.environ.setdefault("LUNANODE_DISABLE_GPU_INIT", "0")
-os.environ.setdefault("REQUESTS_CA_BUNDLE", certifi.where())
-os.environ.setdefault("SSL_CERT_FILE", certifi.where())
+def _bootstrap_env():
+    defaults = dict(_ENV_DEFAULTS)
+    if _is_frozen_like():
+        defaults.update(_FROZEN_ENV_DEFAULTS)
+    for key, value in defaults.items():
+        os.environ.setdefault(key, value)
+
+_bootstrap_env()
+
+# Home and per-user roots, resolved once for the CUDA probe and dir setup below
+_HOME = os.path.expanduser("~")
+_LOCALAPPDATA = os.environ.get("LOCALAPPDATA") or os.path.join(_HOME, "AppData", "Local")
 
 def _ensure_cuda_env():
     """Best-effort CUDA env normalization for packaged builds."""
@@ -57,6 +82,16 @@ def _ensure_cuda_env():
         os.environ.setdefault("CUDA_VISIBLE_DEVICES", "0")
 
         cuda_path = os.environ.get("CUDA_PATH")
+        # Last probe hit is remembered so a warm start costs one isdir() instead of nine
+        cache_file = Path(_LOCALAPPDATA, "LunaNode", "cuda_path.txt")
+        if not cuda_path:
+            try:
+                cached = cache_file.read_text(encoding="utf-8").strip()
+                if cached and os.path.isdir(cached):
+                    cuda_path = cached
+                    os.environ["CUDA_PATH"] = cached
+            except Exception:
+                pass
         if not cuda_path:
             candidates = [
                 r"C:\Program Files\NVIDIA GPU Computing Toolkit\CUDA\v12.4",
@@ -73,6 +108,11 @@ def _ensure_cuda_env():
                 if os.path.isdir(candidate):
                     cuda_path = candidate
                     os.environ["CUDA_PATH"] = candidate
+                    try:
+                        cache_file.parent.mkdir(parents=True, exist_ok=True)
+                        cache_file.write_text(candidate, encoding="utf-8")
+                    except Exception:
+                        pass
                     break
 
         if cuda_path:
@@ -88,24 +128,22 @@ _ensure_cuda_env()
 # Preconfigure data dirs to avoid MissingPlatformDirectoryException on Linux
 if sys.platform != "emscripten":
     if os.name != "nt":
-        os.environ.setdefault("HOME", os.path.expanduser("~"))
+        os.environ.setdefault("HOME", _HOME)
     if os.name == "nt":
-        base_data = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local")) / "LunaNode"
+        base_data_dir = os.path.join(_LOCALAPPDATA, "LunaNode")
     else:
-        base_data = Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share")) / "LunaNode"
+        base_data_dir = os.path.join(os.environ.get("XDG_DATA_HOME") or os.path.join(_HOME, ".local", "share"), "LunaNode")
+    # exist_ok: a warm start costs one failed mkdir, and deleted dirs come back
     try:
-        base_data.mkdir(parents=True, exist_ok=True)
+        os.makedirs(base_data_dir, exist_ok=True)
     except Exception:
         pass
-    os.environ.setdefault("LUNALIB_DATA_DIR", str(base_data))
-    os.environ.setdefault("XDG_DATA_HOME", str(base_data))
-    os.environ.setdefault("XDG_CONFIG_HOME", str(base_data))
-    os.environ.setdefault("XDG_CACHE_HOME", str(base_data))
-    os.environ.setdefault("XDG_DOCUMENTS_DIR", str(base_data))
+    for _key in ("LUNALIB_DATA_DIR", "XDG_DATA_HOME", "XDG_CONFIG_HOME", "XDG_CACHE_HOME", "XDG_DOCUMENTS_DIR"):
+        os.environ.setdefault(_key, base_data_dir)
 
 import flet as ft
 
-from utils import DataManager, NodeConfig, is_valid_luna_address, log_mining_debug_event
+from utils import DataManager, is_valid_luna_address, log_mining_debug_event
 
 # Import unified balance utilities (if needed)
 from utils import LunaNode
@@ -129,10 +167,10 @@ if sys.platform == "emscripten":
     cache_dir = Path("/home/pyodide/.lunalib/cache")
 else:
     if os.name == "nt":
-        base_cache = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+        base_cache = _LOCALAPPDATA
     else:
-        base_cache = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
-    cache_dir = base_cache / "lunalib" / "cache"
+        base_cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(_HOME, ".cache")
+    cache_dir = Path(base_cache, "lunalib", "cache")
 cache_dir.mkdir(parents=True, exist_ok=True)
 os.environ["LUNALIB_CACHE_DIR"] = str(cache_dir)
 
@@ -162,6 +200,13 @@ if sys.platform == "emscripten":
     except Exception:
         pass
 
+_ENV_READY = True
+
+def _require_env_ready():
+    """os.environ must not change once worker threads exist"""
+    if not _ENV_READY:
+        raise RuntimeError("environment must be configured before threads start")
+
 # Import lunalib after cache setup
 # Import GUI modules
 from gui.sidebar import Sidebar
@@ -174,11 +219,74 @@ from gui.settings import SettingsPage
 # Import lunalib after cache setup
 import lunalib
 
+# PyInstaller bundle dir, or the start-up cwd in dev
+_RESOURCE_BASE = getattr(sys, '_MEIPASS', None) or os.path.abspath(".")
+
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller bundle."""
-    if hasattr(sys, '_MEIPASS'):
-        return os.path.join(sys._MEIPASS, relative_path)
-    return os.path.join(os.path.abspath("."), relative_path)
+    return os.path.join(_RESOURCE_BASE, relative_path)
+
+@functools.lru_cache(maxsize=256)
+def _addr_ok(address: str) -> bool:
+    """is_valid_luna_address, memoised per (stripped) address"""
+    return is_valid_luna_address(address)
+
+# Taskbar icon, resolved once (None when the .ico is not shipped)
+_NODE_ICON = os.path.abspath("node_icon.ico") if os.path.exists("node_icon.ico") else None
+
+# App debug output goes through the "lunanode" logger set up in utils; WARNING
+# unless LUNANODE_DEBUG_LOG=1, so debug records are dropped before formatting
+_log = logging.getLogger("lunanode.app")
+if str(os.getenv("LUNANODE_DEBUG_LOG", "0")).strip() != "1":
+    _log.setLevel(logging.WARNING)
+
+# Feather icon SVG bytes, read from disk once per icon
+_ICON_CACHE = {}
+
+def _feather_icon_src(icon_name: str):
+    """Inline SVG bytes for ft.Image (falls back to the asset path)"""
+    src = _ICON_CACHE.get(icon_name)
+    if src is None:
+        path = f"assets/icons/feather/{icon_name}.svg"
+        try:
+            src = Path(resource_path(path)).read_bytes()
+        except OSError:
+            src = path
+        _ICON_CACHE[icon_name] = src
+    return src
+
+# Shared palette for the main layout, tabs, snack bar and About overlay
+_CLR_ACCENT = "#00a1ff"
+_CLR_FG = "#e3f2fd"
+_CLR_DIVIDER = "#1e3a5c"
+_CLR_CONTENT_BG = "#1a2b3c"
+_CLR_PANEL_BG = "#0f1a2a"
+
+# Static style values (plain data, safe to share between controls)
+_SNACK_SHAPE = ft.RoundedRectangleBorder(radius=3)
+_CUSTOM_FONTS = {"Custom": "./font.ttf"}
+_CUSTOM_THEME = ft.Theme(font_family="Custom")
+
+class StatusPoller:
+    """Poll interval that backs off while node status repeats and snaps back on change"""
+
+    def __init__(self, min_interval: float = 1.0, max_interval: float = 5.0):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.current = min_interval
+        self.last_hash = None
+
+    def observe(self, status) -> bool:
+        """Record one poll; True when status differs from the previous poll"""
+        h = hash(repr(status))
+        changed = h != self.last_hash
+        self.last_hash = h
+        if changed:
+            self.current = self.min_interval
+        else:
+            self.current = min(self.max_interval, self.current * 1.5)
+        return changed
 
 class LunaNodeApp:
     def show_first_boot_wizard(self):
@@ -195,48 +303,40 @@ class LunaNodeApp:
         gpu_switch = ft.Switch(label="GPU Acceleration", value=getattr(config, "use_gpu", False))
         error_text = ft.Text("", color="#ff5252", size=12)
 
-        steps = []
-
-        def step_wallet():
-            return ft.Column([
-                ft.Text("Step 1 of 3: Wallet"),
-                wallet_field,
-                error_text,
-            ], tight=True, spacing=10)
-
-        def step_network():
-            return ft.Column([
-                ft.Text("Step 2 of 3: Network"),
-                node_url_field,
-            ], tight=True, spacing=10)
-
-        def step_mining():
-            return ft.Column([
-                ft.Text("Step 3 of 3: Mining"),
-                ft.Row([difficulty_field, mining_interval_field]),
-                ft.Row([auto_mine_switch, gpu_switch]),
-            ], tight=True, spacing=10)
-
-        steps[:] = [step_wallet, step_network, step_mining]
+        # Each step is built once; Back/Next only swap which one is shown
+        col_wallet = ft.Column([
+            ft.Text("Step 1 of 3: Wallet"),
+            wallet_field,
+            error_text,
+        ], tight=True, spacing=10)
+        col_network = ft.Column([
+            ft.Text("Step 2 of 3: Network"),
+            node_url_field,
+        ], tight=True, spacing=10)
+        col_mining = ft.Column([
+            ft.Text("Step 3 of 3: Mining"),
+            ft.Row([difficulty_field, mining_interval_field]),
+            ft.Row([auto_mine_switch, gpu_switch]),
+        ], tight=True, spacing=10)
+
+        steps = [col_wallet, col_network, col_mining]
         step_index = {"value": 0}
 
         content = ft.Column([], tight=True, spacing=10)
 
         def render_step():
-            content.controls.clear()
-            content.controls.append(steps[step_index["value"]]())
-            dialog.title = ft.Text("First-time Setup")
+            content.controls[:] = [steps[step_index["value"]]]
             prev_btn.disabled = step_index["value"] == 0
             next_btn.visible = step_index["value"] < len(steps) - 1
             finish_btn.visible = step_index["value"] == len(steps) - 1
-            self.page.update()
+            self._schedule_update()
 
         def go_next(_):
             if step_index["value"] == 0:
                 value = (wallet_field.value or "").strip()
-                if not is_valid_luna_address(value):
+                if not _addr_ok(value):
                     error_text.value = "Invalid address format. Use LUN_..."
-                    self.page.update()
+                    self._schedule_update()
                     return
                 error_text.value = ""
             step_index["value"] += 1
@@ -248,9 +348,9 @@ class LunaNodeApp:
 
         def finish(_):
             value = (wallet_field.value or "").strip()
-            if not is_valid_luna_address(value):
+            if not _addr_ok(value):
                 error_text.value = "Invalid address format. Use LUN_..."
-                self.page.update()
+                self._schedule_update()
                 return
 
             config.miner_address = value
@@ -269,7 +369,7 @@ class LunaNodeApp:
             config.save_to_storage()
 
             dialog.open = False
-            self.page.update()
+            self._schedule_update()
 
             if config.auto_mine:
                 threading.Thread(target=self.start_mining, daemon=True).start()
@@ -304,14 +404,14 @@ class LunaNodeApp:
 
         def save_address(_):
             value = (address_field.value or "").strip()
-            if not is_valid_luna_address(value):
+            if not _addr_ok(value):
                 error_text.value = "Invalid address format. Use LUN_..."
-                self.page.update()
+                self._schedule_update()
                 return
             self.node.config.miner_address = value
             self.node.config.save_to_storage()
             dialog.open = False
-            self.page.update()
+            self._schedule_update()
             self.add_log_message("Wallet address updated", "success")
             threading.Thread(target=self.start_mining, daemon=True).start()
 
@@ -331,173 +431,197 @@ class LunaNodeApp:
 
         self.page.dialog = dialog
         dialog.open = True
-        self.page.update()
+        self._schedule_update()
+
+    def _bind_mining_controls(self):
+        """Cache the controls _set_mining_ui_state touches"""
+        main_page = self.main_page
+        self._cpu_btn = getattr(main_page, "cpu_toggle_btn", None)
+        self._gpu_btn = getattr(main_page, "gpu_toggle_btn", None)
+        mining_status = getattr(main_page, "mining_status", None)
+        try:
+            self._status_label = mining_status.content.controls[1] if mining_status else None
+        except Exception:
+            self._status_label = None
+        self._sidebar_cpu_btn = getattr(self.sidebar, "btn_cpu_mining", None)
+        self._sidebar_gpu_btn = getattr(self.sidebar, "btn_gpu_mining", None)
 
     def _set_mining_ui_state(self, is_mining: bool, pending: bool = False, status_text: str = None):
-        if hasattr(self, "main_page") and self.main_page:
-            try:
-                if pending:
-                    if hasattr(self.main_page, "cpu_toggle_btn"):
-                        self.main_page.cpu_toggle_btn.disabled = True
-                    if hasattr(self.main_page, "gpu_toggle_btn"):
-                        self.main_page.gpu_toggle_btn.disabled = True
-                    if status_text:
-                        self.main_page.mining_status.content.controls[1].value = status_text
-                else:
-                    if status_text:
-                        self.main_page.mining_status.content.controls[1].value = status_text
-            except Exception:
-                pass
+        if pending:
+            for btn in (self._cpu_btn, self._gpu_btn, self._sidebar_cpu_btn, self._sidebar_gpu_btn):
+                if btn:
+                    btn.disabled = True
+        if status_text and self._status_label:
+            self._status_label.value = status_text
+
+        self._schedule_update()
+        if not pending:
+            # Mining state settled: refresh stats now instead of after the idle interval
+            self._invalidate_status()
+            self._stats_wake_event.set()
 
-        if hasattr(self, "sidebar") and self.sidebar:
-            try:
-                if pending:
-                    if hasattr(self.sidebar, "btn_cpu_mining"):
-                        self.sidebar.btn_cpu_mining.disabled = True
-                    if hasattr(self.sidebar, "btn_gpu_mining"):
-                        self.sidebar.btn_gpu_mining.disabled = True
-            except Exception:
-                pass
+    def on_mining_started(self):
+        """Called when mining starts"""
+        self.add_log_message("Mining started", "info")
+        self._invalidate_status()
+        self._stats_wake_event.set()
+
+    @property
+    def _mining_transition(self) -> bool:
+        """True while a start/stop/toggle is in flight (pages keep buttons untouched)"""
+        return self._mining_lock.locked()
+
+    def _run_mining_action(self, fn, error_label: str, pending_mining: bool, status_text: str) -> bool:
+        """Run one mining start/stop/toggle on the mining worker; False if one is already running"""
+        if not self._mining_lock.acquire(blocking=False):
+            return False
+        self._post(self._set_mining_ui_state, pending_mining, pending=True, status_text=status_text)
 
-        if self.page:
+        def _run():
             try:
-                self.page.update()
-            except Exception:
-                pass
+                fn()
+            except Exception as e:
+                self.add_log_message(f"{error_label}: {e}", "error")
+            finally:
+                self._mining_lock.release()
+                self._post(self._set_mining_ui_state, False, pending=False, status_text=None)
 
-    def on_mining_started(self):
-        """Called when mining starts"""
-        self.safe_run_thread(lambda: self.add_log_message("Mining started", "info"))
+        try:
+            self._mining_exec.submit(_run)
+        except Exception as e:
+            self._mining_lock.release()
+            self.add_log_message(f"{error_label}: {e}", "error")
+            return False
+        return True
 
     def start_mining(self):
         """Start auto-mining"""
-        if getattr(self, "_mining_transition", False):
+        if self._mining_transition:
             return
         self.add_log_message("Start Mining clicked", "info")
-        if not self.node:
+        node = self.node
+        if not node:
             self.add_log_message("Node is still initializing. Please wait...", "warning")
-            if self.page:
-                self.safe_run_thread(lambda: self._set_mining_ui_state(False, pending=False, status_text="Mining Stopped"))
+            self._post(self._set_mining_ui_state, False, pending=False, status_text="Mining Stopped")
             return
 
-        if not is_valid_luna_address(getattr(self.node.config, "miner_address", "")):
+        if not _addr_ok((getattr(node.config, "miner_address", "") or "").strip()):
             self.add_log_message("Set a valid LUN_ address before mining.", "warning")
             self.safe_run_thread(self.show_address_setup_dialog)
-            if self.page:
-                self.safe_run_thread(lambda: self._set_mining_ui_state(False, pending=False, status_text="Mining Stopped"))
+            self._post(self._set_mining_ui_state, False, pending=False, status_text="Mining Stopped")
             return
 
-        if self.node:
+        def _start():
             try:
-                self._mining_transition = True
-                if self.page:
-                    self.safe_run_thread(lambda: self._set_mining_ui_state(True, pending=True, status_text="Starting..."))
-
-                def _start():
-                    try:
-                        try:
-                            self.node.config.auto_mine = True
-                            self.node.config.save_to_storage()
-                        except Exception:
-                            pass
-                        started = self.node.start_auto_mining()
-                        if started:
-                            self.safe_run_thread(lambda: self.add_log_message("Auto-mining started", "success"))
-                        else:
-                            self.safe_run_thread(lambda: self.add_log_message("Auto-mining could not start. Check logs for details.", "error"))
-                    except Exception as e:
-                        self.safe_run_thread(lambda: self.add_log_message(f"Failed to start mining: {e}", "error"))
-                    finally:
-                        self.safe_run_thread(lambda: self._set_mining_ui_state(False, pending=False, status_text=None))
-                        self._mining_transition = False
+                node.config.auto_mine = True
+                node.config.save_to_storage()
+            except Exception:
+                pass
+            if node.start_auto_mining():
+                self.add_log_message("Auto-mining started", "success")
+            else:
+                self.add_log_message("Auto-mining could not start. Check logs for details.", "error")
 
-                threading.Thread(target=_start, daemon=True).start()
-            except Exception as e:
-                self.add_log_message(f"Failed to start mining: {e}", "error")
-                self._mining_transition = False
+        self._run_mining_action(_start, "Failed to start mining", True, "Starting...")
 
     def stop_mining(self):
         """Stop auto-mining"""
-        if getattr(self, "_mining_transition", False):
+        node = self.node
+        if not node:
             return
-        if self.node:
-            try:
-                self._mining_transition = True
-                if self.page:
-                    self.safe_run_thread(lambda: self._set_mining_ui_state(False, pending=True, status_text="Stopping..."))
-                def _stop():
-                    try:
-                        self.node.stop_auto_mining()
-                        self.safe_run_thread(lambda: self.add_log_message("Auto-mining stopped", "info"))
-                    except Exception as e:
-                        self.safe_run_thread(lambda: self.add_log_message(f"Failed to stop mining: {e}", "error"))
-                    finally:
-                        self.safe_run_thread(lambda: self._set_mining_ui_state(False, pending=False, status_text=None))
-                        self._mining_transition = False
-                threading.Thread(target=_stop, daemon=True).start()
-            except Exception as e:
-                self.add_log_message(f"Failed to stop mining: {e}", "error")
-                self._mining_transition = False
 
-    def toggle_cpu_mining(self):
-        """Toggle CPU mining on/off."""
-        if getattr(self, "_mining_transition", False):
-            return
-        if not self.node:
+        def _stop():
+            node.stop_auto_mining()
+            self.add_log_message("Auto-mining stopped", "info")
+
+        self._run_mining_action(_stop, "Failed to stop mining", False, "Stopping...")
+
+    def _toggle_mining_kind(self, kind: str):
+        """Flip CPU or GPU mining based on a fresh status read"""
+        node = self.node
+        if not node:
             self.add_log_message("Node is still initializing. Please wait...", "warning")
             return
-        self._mining_transition = True
-        if self.page:
-            self.safe_run_thread(lambda: self._set_mining_ui_state(False, pending=True, status_text="CPU: Switching..."))
 
         def _toggle():
-            try:
-                status = self.node.get_status() if self.node else {}
-                is_active = bool(status.get("cpu_mining_active"))
-                if is_active:
-                    self.node.stop_cpu_mining()
-                else:
-                    self.node.start_cpu_mining()
-            except Exception as e:
-                self.safe_run_thread(lambda: self.add_log_message(f"CPU mining toggle failed: {e}", "error"))
-            finally:
-                self.safe_run_thread(lambda: self._set_mining_ui_state(False, pending=False, status_text=None))
-                self._mining_transition = False
+            status = node.get_status(ttl=0)
+            if status.get(f"{kind}_mining_active"):
+                getattr(node, f"stop_{kind}_mining")()
+            else:
+                getattr(node, f"start_{kind}_mining")()
 
-        threading.Thread(target=_toggle, daemon=True).start()
+        label = kind.upper()
+        self._run_mining_action(_toggle, f"{label} mining toggle failed", False, f"{label}: Switching...")
+
+    def toggle_cpu_mining(self):
+        """Toggle CPU mining on/off."""
+        self._toggle_mining_kind("cpu")
 
     def toggle_gpu_mining(self):
         """Toggle GPU mining on/off."""
-        if getattr(self, "_mining_transition", False):
-            return
-        if not self.node:
-            self.add_log_message("Node is still initializing. Please wait...", "warning")
-            return
-        self._mining_transition = True
-        if self.page:
-            self.safe_run_thread(lambda: self._set_mining_ui_state(False, pending=True, status_text="GPU: Switching..."))
-
-        def _toggle():
-            try:
-                status = self.node.get_status() if self.node else {}
-                is_active = bool(status.get("gpu_mining_active"))
-                if is_active:
-                    self.node.stop_gpu_mining()
-                else:
-                    self.node.start_gpu_mining()
-            except Exception as e:
-                self.safe_run_thread(lambda: self.add_log_message(f"GPU mining toggle failed: {e}", "error"))
-            finally:
-                self.safe_run_thread(lambda: self._set_mining_ui_state(False, pending=False, status_text=None))
-                self._mining_transition = False
-
-        threading.Thread(target=_toggle, daemon=True).start()
+        self._toggle_mining_kind("gpu")
    
     def __init__(self):
         self.node = None
         self.minimized_to_tray = False
+        # False while the window is minimized/hidden (see on_window_event)
+        self._page_visible = True
         self.current_tab_index = 0
+        # Mining buttons/status label, bound once the layout exists (see _bind_mining_controls)
+        self._cpu_btn = None
+        self._gpu_btn = None
+        self._status_label = None
+        self._sidebar_cpu_btn = None
+        self._sidebar_gpu_btn = None
+        # Tab bodies other than Mining are built on first selection
+        self._tab_views = []
+        self._tab_built = [True, False, False, False, False]
         self._stats_updater_started = False
+        # Wakes the stats loop early (mining state change / shutdown)
+        self._stats_wake_event = threading.Event()
+        # Held while a mining start/stop/toggle runs (see _run_mining_action)
+        self._mining_lock = threading.Lock()
+        # Set once the main layout is on the page (node init may finish first)
+        self._layout_ready = threading.Event()
+        # While > 0, safe_page_update() only marks the page dirty
+        self._page_update_batch = 0
+        self._page_dirty = False
+        self._page_batch_lock = threading.Lock()
+        # Single-block mine / network sync run one at a time on this worker
+        # (mining control uses _mining_exec below, never this queue)
+        self._action_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="luna-action")
+        self._current_action_future = None
+        # Mining start/stop/toggle get their own worker so Stop never queues
+        # behind a long single-block mine or sync (_mining_lock serialises them)
+        self._mining_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="luna-mining")
+        # Sync progress from worker threads; each flush applies only the latest
+        self._progress_queue = queue.SimpleQueue()
+        self._progress_widgets = None  # (progress_bar, progress_text) of an open dialog
+        # Timed UI work (snack dismissal, overlay removal) runs on one scheduler thread
+        self._ui_timers = []  # heap of (deadline, seq, fn)
+        self._ui_timer_seq = itertools.count()
+        self._ui_timer_cond = threading.Condition()
+        self._ui_timer_thread = None
+        # One SnackBar is reused for every message (see show_snack_bar)
+        self._snack_bar = None
+        self._snack_gen = 0
+        # Messages arriving while the snack bar is open wait here (newest kept)
+        self._snack_queue = deque(maxlen=5)
+        # About overlay is built on first open and kept in page.overlay
+        self._about_overlay = None
+        # Log lines from any thread are batched to the log page every 100ms
+        self._log_queue = deque(maxlen=2000)
+        # Subsystems needing a redraw; _flush_dirty applies them under one page update
+        # (also the ~16ms debounce behind _schedule_update)
+        self._dirty = set()
+        self._dirty_lock = threading.Lock()
+        self._flush_scheduled = False
+        # Last node.get_status() snapshot (monotonic ts, status); node callbacks invalidate it
+        self._status_cache = (0.0, None)
+        self._status_lock = threading.Lock()
+        # Per-key locks for safe_run_thread(key=...): same-key posts run one at a time
+        self._cb_locks = {}
+        self._cb_locks_guard = threading.Lock()
         self.ui_active = True
         try:
             from colorama import init as colorama_init
@@ -518,6 +642,33 @@ class LunaNodeApp:
         self.bills_page = BillsPage(self)
         self.settings_page = SettingsPage(self)
         self.log_page = LogPage(self)
+        # Per-tab dispatch in tab order (Mining, History, Bills, Settings, Log)
+        self._tab_builders = (
+            None,  # Mining is built eagerly in create_main_content
+            self.mining_history.create_history_tab,
+            self.bills_page.create_bills_tab,
+            self.settings_page.create_settings_tab,
+            self.log_page.create_log_tab,
+        )
+        self._tab_handlers = (
+            self._refresh_mining_tab,
+            self.mining_history.update_history_content,
+            self.bills_page.update_bills_content,
+            self.settings_page.update_settings_content,
+            self.log_page.show_log,
+        )
+        # _flush_dirty refresh order (log first so messages land before the stats they explain)
+        self._dirty_handlers = (
+            ("log", self._drain_log_queue),
+            ("sidebar", self._refresh_sidebar_status),
+            ("main", self.main_page.update_mining_stats),
+            ("history", self.mining_history.update_history_content),
+            ("bills", self.bills_page.update_bills_content),
+            ("settings", self.settings_page.update_settings_content),
+            ("progress", self._apply_queued_progress),
+        )
+        # History / Settings fill their content while being built
+        self._tab_fills_on_build = (False, True, False, True, False)
 
         # Miner is managed by LunaNode
 
@@ -529,19 +680,15 @@ class LunaNodeApp:
     def create_main_ui(self, page: ft.Page):
         """Create the main node interface"""
         self.page = page
+        # Node start-up (disk/network) overlaps with building the layout below;
+        # on_node_initialized waits for _layout_ready
+        self.initialize_node_async()
         # Page setup with blue theme
         page.title = "Luna Node"
         page.theme_mode = ft.ThemeMode.DARK
-        page.fonts = {
-            "Custom": "./font.ttf"
-        }
-        page.theme = ft.Theme(
-            font_family="Custom",
-        )
         # タスクバーアイコンを設定
-        icon_path = os.path.abspath("node_icon.ico")
-        if os.path.exists(icon_path):
-            page.window.icon = icon_path
+        if _NODE_ICON:
+            page.window.icon = _NODE_ICON
         page.padding = 0
         page.window.width = 1024
         page.window.height = 768
@@ -552,17 +699,36 @@ class LunaNodeApp:
         page.on_disconnect = self.on_disconnect
         main_layout = self.create_main_layout()
         page.add(main_layout)
+        self._layout_ready.set()
         self.start_stats_updater()
-        self.initialize_node_async()
-        print("[DEBUG] create_main_ui completed")
+        # Custom font is applied after first paint, in parallel with node init
+        threading.Thread(target=self._apply_custom_font, daemon=True).start()
+        _log.debug("create_main_ui completed")
+
+    def _apply_custom_font(self):
+        try:
+            self.page.fonts = _CUSTOM_FONTS
+            self.page.theme = _CUSTOM_THEME
+        except Exception:
+            return
+        self.safe_page_update()
 
     def on_disconnect(self, e=None):
         """Handle session disconnect to stop UI updates"""
         self.ui_active = False
+        self._stats_wake_event.set()
+        try:
+            self.sidebar.stop_stats_update_timer()
+        except Exception:
+            pass
 
     def safe_page_update(self):
         if not self.page or not self.ui_active:
             return False
+        with self._page_batch_lock:
+            if self._page_update_batch:
+                self._page_dirty = True
+                return True
         try:
             self.page.update()
             return True
@@ -570,9 +736,35 @@ class LunaNodeApp:
             self.ui_active = False
             return False
 
-    def safe_run_thread(self, fn):
+    def _schedule_update(self):
+        """Coalesce page updates requested within ~16ms into one"""
+        self._mark_dirty()
+
+    def run_batched_update(self, fn):
+        """Run fn with page updates coalesced into one at the end"""
+        with self._page_batch_lock:
+            self._page_update_batch += 1
+        try:
+            fn()
+        finally:
+            with self._page_batch_lock:
+                self._page_update_batch -= 1
+                flush = not self._page_update_batch and self._page_dirty
+                if flush:
+                    self._page_dirty = False
+            if flush:
+                self.safe_page_update()
+
+    def _post(self, fn, *args, **kwargs):
+        """Run fn(*args, **kwargs) on the UI thread (partial, no per-call closure)"""
+        return self.safe_run_thread(functools.partial(fn, *args, **kwargs))
+
+    def safe_run_thread(self, fn, key: str = None):
+        """Run fn via page.run_thread; posts sharing a key never overlap"""
         if not self.page or not self.ui_active:
             return False
+        if key is not None:
+            fn = functools.partial(self._run_keyed, self._cb_lock(key), fn)
         try:
             self.page.run_thread(fn)
             return True
@@ -580,27 +772,60 @@ class LunaNodeApp:
             self.ui_active = False
             return False
 
+    def _cb_lock(self, key: str):
+        # Double-checked: the global guard is only taken the first time a key is seen
+        lock = self._cb_locks.get(key)
+        if lock is None:
+            with self._cb_locks_guard:
+                lock = self._cb_locks.setdefault(key, threading.Lock())
+        return lock
+
+    @staticmethod
+    def _run_keyed(lock, fn):
+        with lock:
+            fn()
+
     def start_stats_updater(self):
+        _require_env_ready()
         if self._stats_updater_started:
             return
         self._stats_updater_started = True
 
         def stats_loop():
+            poller = StatusPoller()
             while True:
+                visible = self.is_page_visible()
+                node = self.node
+                try:
+                    is_mining = bool(node and node.miner.is_mining)
+                except Exception:
+                    is_mining = False
+                live = is_mining and visible and self.current_tab_index == 0
                 try:
                     if self.page and self.ui_active:
-                        self.safe_run_thread(self.main_page.update_mining_stats)
+                        if live:
+                            # Redraw only when the status actually moved
+                            poller.min_interval = max(0.25, float(node.config.status_poll_min_interval))
+                            poller.max_interval = max(poller.min_interval, float(node.config.status_poll_max_interval))
+                            if poller.observe(self.get_status_cached()):
+                                self.safe_run_thread(self.main_page.update_mining_stats, key="stats")
+                        elif visible and self.current_tab_index == 0:
+                            self.safe_run_thread(self.main_page.update_mining_stats, key="stats")
                     elif not self.ui_active:
                         break
                 except Exception:
                     pass
-                try:
-                    sleep_s = 5
-                    if self.node and not self.node.miner.is_mining:
-                        sleep_s = 15
-                except Exception:
-                    sleep_s = 5
-                time.sleep(sleep_s)
+                # Node callbacks wake this loop; the timeout is only a fallback
+                # (adaptive live polling while mining on the Mining tab, drift
+                # correction otherwise, rare polling from the tray)
+                if self.minimized_to_tray:
+                    sleep_s = 60
+                elif live:
+                    sleep_s = poller.current
+                else:
+                    sleep_s = 30
+                if self._stats_wake_event.wait(sleep_s):
+                    self._stats_wake_event.clear()
 
         threading.Thread(target=stats_loop, daemon=True).start()
         
@@ -608,12 +833,13 @@ class LunaNodeApp:
         """Create the main layout with sidebar and content area"""
         sidebar = self.sidebar.create_sidebar()
         main_content = self.create_main_content()
+        self._bind_mining_controls()
         layout = ft.Row([
             sidebar,
             ft.Container(
                 content=main_content,
                 expand=True,
-                bgcolor="#1a2b3c",
+                bgcolor=_CLR_CONTENT_BG,
                 padding=0,
                 margin=0,
             )
@@ -626,13 +852,13 @@ class LunaNodeApp:
                 label=ft.Row(
                     [
                         ft.Image(
-                            src=f"assets/icons/feather/{icon_name}.svg",
+                            src=_feather_icon_src(icon_name),
                             width=16,
                             height=16,
-                            color="#e3f2fd",
+                            color=_CLR_FG,
                             color_blend_mode=ft.BlendMode.SRC_IN,
                         ),
-                        ft.Text(text, size=12, color="#e3f2fd"),
+                        ft.Text(text, size=12, color=_CLR_FG),
                     ],
                     spacing=6,
                     alignment=ft.MainAxisAlignment.CENTER,
@@ -646,13 +872,10 @@ class LunaNodeApp:
             _tab_label("settings", "Settings"),
             _tab_label("file-text", "Log"),
         ]
-        tab_contents = [
-            self.main_page.create_mining_tab(),
-            self.mining_history.create_history_tab(),
-            self.bills_page.create_bills_tab(),
-            self.settings_page.create_settings_tab(),
-            self.log_page.create_log_tab(),
-        ]
+        tab_contents = [ft.Container(content=self.main_page.create_mining_tab(), expand=True)]
+        tab_contents += [ft.Container(expand=True) for _ in tab_labels[1:]]
+        self._tab_views = tab_contents
+        self._tab_built = [True] + [False] * (len(tab_labels) - 1)
         tab_bar = ft.TabBar(tabs=tab_labels)
         tab_bar_view = ft.TabBarView(controls=tab_contents, expand=True)
         tabs_control = ft.Tabs(
@@ -666,44 +889,91 @@ class LunaNodeApp:
             expand=True,
         )
         return tabs_control
+
+    def _ensure_tab_built(self, index: int) -> bool:
+        """Build a tab body on first selection; True if it was built now"""
+        if index >= len(self._tab_views) or self._tab_built[index]:
+            return False
+        builder = self._tab_builders[index]
+        if builder is None:
+            return False
+        self._tab_views[index].content = builder()
+        self._tab_built[index] = True
+        self.safe_page_update()
+        return True
         
     def on_tab_change(self, e):
         """Handle tab changes"""
-        self.current_tab_index = e.control.selected_index
-        if self.current_tab_index == 0:
-            print("[DEBUG] Mining tab selected: updating mining stats")
-            self.main_page.update_mining_stats()
-            if self.node:
-                try:
-                    status = self.node.get_status()
-                    self.sidebar.refresh_non_balance(status)
-                except Exception:
-                    pass
-        elif self.current_tab_index == 1:
-            print("[DEBUG] History tab selected: updating history content")
-            self.mining_history.update_history_content()
-        elif self.current_tab_index == 2:
-            print("[DEBUG] Bills tab selected: updating bills content")
-            self.bills_page.update_bills_content()
-        elif self.current_tab_index == 3:  # Settings tab
-            print("[DEBUG] Settings tab selected: updating settings content")
-            self.settings_page.update_settings_content()
-        elif self.current_tab_index == 4:  # Log tab
-            print("[DEBUG] Log tab selected")
+        index = e.control.selected_index
+        self.current_tab_index = index
+        if index == 0:
+            # Back on the Mining tab: drop out of the 30s idle interval
+            self._stats_wake_event.set()
+        just_built = self._ensure_tab_built(index)
+        if index >= len(self._tab_handlers):
+            return
+        _log.debug("Tab %s selected", index)
+        if just_built and self._tab_fills_on_build[index]:
+            return
+        self._tab_handlers[index]()
+
+    def _refresh_mining_tab(self):
+        self.main_page.update_mining_stats()
+        if self.node:
+            try:
+                status = self.get_status_cached()
+                self.sidebar.refresh_non_balance(status)
+            except Exception:
+                pass
             
+    def get_status_cached(self, ttl: float = 0.5):
+        """node.get_status(), shared by UI readers for ttl seconds (None before init)"""
+        node = self.node
+        if not node:
+            return None
+        with self._status_lock:
+            ts, status = self._status_cache
+            if status is not None and time.monotonic() - ts < ttl:
+                return status
+            # This layer does the sharing; bypass the node's own memo and
+            # stamp the entry once the fetch has actually returned
+            status = node.get_status(ttl=0)
+            self._status_cache = (time.monotonic(), status)
+            return status
+
+    def _invalidate_status(self):
+        with self._status_lock:
+            self._status_cache = (0.0, None)
+        # The node memoises get_status() too; drop that snapshot as well
+        node = self.node
+        if node:
+            try:
+                node._invalidate_status_cache()
+            except Exception:
+                pass
+
+    def is_page_visible(self) -> bool:
+        """True unless the window is minimized, hidden or in the tray"""
+        return self._page_visible and not self.minimized_to_tray
+
     def on_window_event(self, e):
         """Handle window events"""
         if e.data == "close":
             self.minimize_to_tray()
             return False
+        if e.data in ("minimize", "hide"):
+            self._page_visible = False
+        elif e.data in ("restore", "show", "focus"):
+            self._page_visible = True
+            self._stats_wake_event.set()
         return True
         
-            # concise: skip debug
+    def minimize_to_tray(self):
         """Minimize to system tray"""
         self.minimized_to_tray = True
         self.page.window.minimized = True
         self.page.window.visible = False
-        self.page.update()
+        self._schedule_update()
         self.show_snack_bar("Luna Node minimized to system tray")
         
     def restore_from_tray(self):
@@ -711,154 +981,306 @@ class LunaNodeApp:
         self.minimized_to_tray = False
         self.page.window.visible = True
         self.page.window.minimized = False
-        self.page.update()
+        self._schedule_update()
+        self._stats_wake_event.set()
             # concise: skip debug
     def show_snack_bar(self, message: str):
         """Show snack bar message"""
-        snack_bar = ft.SnackBar(
-            content=ft.Text(message),
-            shape=ft.RoundedRectangleBorder(radius=3),
-            bgcolor="#00a1ff"
-        )
-        self.page.overlay.append(snack_bar)
+        snack_bar = self._snack_bar
+        if snack_bar is None:
+            snack_bar = ft.SnackBar(
+                content=ft.Text(""),
+                shape=_SNACK_SHAPE,
+                bgcolor=_CLR_ACCENT
+            )
+            self.page.overlay.append(snack_bar)
+            self._snack_bar = snack_bar
+        elif snack_bar.open:
+            # Let the current message finish its window instead of overwriting it
+            self._snack_queue.append(message)
+            return
+        self._open_snack_bar(message)
+
+    def _open_snack_bar(self, message: str):
+        snack_bar = self._snack_bar
+        snack_bar.content.value = message
         snack_bar.open = True
-        self.page.update()
-        def remove_snack():
-            time.sleep(3)
-            self.page.overlay.remove(snack_bar)
-            self.page.update()
-        threading.Thread(target=remove_snack, daemon=True).start()
+        self._snack_gen += 1
+        self._schedule_update()
+        self.call_later(3, functools.partial(self._close_snack_bar, self._snack_gen))
+
+    def _close_snack_bar(self, gen: int):
+        if gen != self._snack_gen or self._snack_bar is None:
+            return
+        if self._snack_queue:
+            self._open_snack_bar(self._snack_queue.popleft())
+            return
+        self._snack_bar.open = False
+        self._schedule_update()
+
+    def call_later(self, delay: float, fn):
+        """Run fn after delay seconds on the shared UI scheduler thread"""
+        with self._ui_timer_cond:
+            heapq.heappush(self._ui_timers, (time.monotonic() + delay, next(self._ui_timer_seq), fn))
+            self._ui_timer_cond.notify()
+            if not (self._ui_timer_thread and self._ui_timer_thread.is_alive()):
+                self._ui_timer_thread = threading.Thread(target=self._ui_timer_loop, daemon=True)
+                self._ui_timer_thread.start()
+
+    def _ui_timer_loop(self):
+        while True:
+            with self._ui_timer_cond:
+                while not self._ui_timers:
+                    self._ui_timer_cond.wait()
+                deadline, _seq, fn = self._ui_timers[0]
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    # Re-check on wake: an earlier timer may have been added
+                    self._ui_timer_cond.wait(remaining)
+                    continue
+                heapq.heappop(self._ui_timers)
+            try:
+                fn()
+            except Exception:
+                pass
         
     def initialize_node_async(self):
         """Initialize node in background thread"""
+        _require_env_ready()
         def init_thread():
             try:
             # concise: skip debug
-                print("[DEBUG] Initializing LunaNode")
+                _log.debug("Initializing LunaNode")
                 
                 self.node = LunaNode(
                     log_callback=self.add_log_message,
-                    new_bill_callback=lambda bill: self.add_log_message(f"New bill mined: {bill}", "success"),
-                    new_reward_callback=lambda reward: self.add_log_message(f"New reward: {reward}", "success"),
+                    new_bill_callback=self.on_new_bill,
+                    new_reward_callback=self.on_new_reward,
                     history_updated_callback=self.update_history_content,
                     mining_started_callback=self.on_mining_started,
                     mining_completed_callback=self.on_mining_completed
                 )
+                self._layout_ready.wait()
                 self.safe_run_thread(self.on_node_initialized)
                 
             except Exception as e:
                 print(f"[ERROR] {e}")
-                self.safe_run_thread(lambda e=e: self.add_log_message(str(e), "error"))
+                self.add_log_message(str(e), "error")
         threading.Thread(target=init_thread, daemon=True).start()
         
                 # concise: skip debug
         """Called when mining starts"""
-        self.safe_run_thread(lambda: self.add_log_message("Mining started", "info"))
+        self.add_log_message("Mining started", "info")
         
+    def on_new_bill(self, bill):
+        self.add_log_message(f"New bill mined: {bill}", "success")
+        self._invalidate_status()
+        self._stats_wake_event.set()
+
+    def on_new_reward(self, reward):
+        self.add_log_message(f"New reward: {reward}", "success")
+        self._invalidate_status()
+        self._stats_wake_event.set()
+
     def on_mining_completed(self, success, message):
         """Called when mining completes"""
         msg_type = "success" if success else "warning"
-        self.safe_run_thread(lambda: self.add_log_message(message, msg_type))
+        self.add_log_message(message, msg_type)
+        # New block / failed attempt: refresh stats now rather than on the next tick
+        self._invalidate_status()
+        self._stats_wake_event.set()
         
     def on_node_initialized(self):
         """Called when node is successfully initialized"""
         self.add_log_message("Luna Node initialized successfully", "success")
         self.add_log_message("Loaded data from ./data/ directory", "info")
-        # Debugging DataManager and NodeConfig initialization
-        print("[DEBUG] Initializing DataManager")
-        data_manager = DataManager()
-        print("[DEBUG] DataManager initialized:", data_manager)
-        print("[DEBUG] Initializing NodeConfig")
-        config = NodeConfig(data_manager)
-        print("[DEBUG] NodeConfig initialized:", config)
-        print("[DEBUG] Type of data_manager before load_mining_history:", type(data_manager))
-        print("[DEBUG] Value of data_manager before load_mining_history:", data_manager)
-        print("[DEBUG] Type of data_manager before calling load_mining_history:", type(data_manager))
-        print("[DEBUG] Value of data_manager before calling load_mining_history:", data_manager)
-        # Load mining history using DataManager
-        #mining_history = data_manager.load_mining_history()
-        #print("[DEBUG] Loaded mining history:", mining_history)
+        self._invalidate_status()
         # Refresh settings tab so it shows real settings after node is ready
-        if hasattr(self, "settings_page"):
-            try:
-                self.settings_page.update_settings_content()
-            except Exception as e:
-                print(f"[DEBUG] settings_page.update_settings_content() failed: {e}")
         # Miningタブの統計を初期化し、自動マイニングを開始（シングルブロックマイニング等は絶対に行わない）
-        if hasattr(self, "main_page"):
-            try:
-                self.main_page.update_mining_stats()
-            except Exception as e:
-                print(f"[DEBUG] main_page.update_mining_stats() failed: {e}")
+        self._mark_dirty("settings", "main")
         # 初回起動ウィザード or 既存設定
         try:
             needs_setup = not getattr(self.node.config, "setup_complete", False)
-            invalid_address = not is_valid_luna_address(self.node.config.miner_address)
+            address_ok = _addr_ok((self.node.config.miner_address or "").strip())
+            invalid_address = not address_ok
 
             if needs_setup or invalid_address:
                 self.safe_run_thread(self.show_first_boot_wizard)
-            elif is_valid_luna_address(self.node.config.miner_address):
+            elif address_ok:
                 if getattr(self.node.config, "auto_mine", False):
                     threading.Thread(target=self.start_mining, daemon=True).start()
             else:
                 self.safe_run_thread(self.show_address_setup_dialog)
         except Exception as e:
-            print(f"[DEBUG] start_mining() failed: {e}")
-        print("[DEBUG] LunaNode instance after initialization:", self.node)
-        print("[DEBUG] Type of self.node.data_manager:", type(self.node.data_manager))
+            _log.debug("start_mining() failed: %s", e)
+        if __debug__ and _log.isEnabledFor(logging.DEBUG):
+            _log.debug("LunaNode instance after initialization: %s", self.node)
+            _log.debug("Type of self.node.data_manager: %s", type(self.node.data_manager))
                     # concise: skip debug
         # Bills content is loaded lazily when the Bills tab is opened
 
 
 
         
-    def update_status_display(self):
-        """Update all status displays"""
+    def _mark_dirty(self, *parts, delay: float = 0.016):
+        """Queue subsystem refreshes (none: page update only); the first mark schedules one flush"""
+        with self._dirty_lock:
+            self._dirty.update(parts)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self.call_later(delay, self._flush_dirty)
+
+    def _flush_dirty(self):
+        """Refresh every dirty subsystem in a fixed order, then update the page once"""
+        with self._dirty_lock:
+            dirty = self._dirty
+            self._dirty = set()
+            self._flush_scheduled = False
+        if not dirty:
+            self.safe_page_update()
+            return
+
+        def _apply():
+            for part, handler in self._dirty_handlers:
+                if part in dirty:
+                    try:
+                        handler()
+                    except Exception as e:
+                        _log.debug("%s refresh failed: %s", part, e)
+
+        # Handlers may hit the network (bills, mempool): keep them off the timer thread
+        if not self.safe_run_thread(functools.partial(self.run_batched_update, _apply), key="dirty"):
+            # No page yet: keep the parts for the next flush
+            with self._dirty_lock:
+                self._dirty |= dirty
+
+    def _refresh_sidebar_status(self):
         if not self.node:
             return
-            
-        status = self.node.get_status()
-        # Update sidebar
-        self.sidebar.update_status(status)
-            
-        # Update mining progress
-        is_mining = self.node.miner.is_mining if self.node else False
-        
-        # Miningタブの統計は常に更新（タブ切替時以外も）
-        self.main_page.update_mining_stats()
-        if self.current_tab_index == 0:
-            pass
-            
-        self.page.update()
+        # Sidebar.update_status skips labels whose field is unchanged
+        self.sidebar.update_status(self.get_status_cached())
         
     def add_log_message(self, message: str, msg_type: str = "info"):
         """Add message to log"""
-        self.log_page.add_log_message(message, msg_type)
+        self._log_queue.append((message, msg_type))
+        self._mark_dirty("log", delay=0.1)
+
+    def _drain_log_queue(self):
+        """Move queued log lines to the log page"""
+        while self._log_queue:
+            message, msg_type = self._log_queue.popleft()
+            self.log_page.add_log_message(message, msg_type)
         
     def clear_log(self):
+        self._log_queue.clear()
         self.log_page.clear_log()
             
+    def _submit_action(self, fn, on_done):
+        """Run fn on the action worker unless one is still running; on_done gets fn's result on the UI thread"""
+        current = self._current_action_future
+        if current is not None and not current.done():
+            self.add_log_message("Action already in progress", "warning")
+            return None
+        if self._mining_transition:
+            # Refuse instead of overlapping a mining start/stop
+            self.add_log_message("Mining is starting/stopping; try again in a moment", "warning")
+            return None
+
+        def _done(future):
+            try:
+                result = future.result()
+            except Exception as e:
+                self.add_log_message(str(e), "error")
+                return
+            self._post(on_done, result)
+
+        future = self._action_exec.submit(fn)
+        self._current_action_future = future
+        future.add_done_callback(_done)
+        return future
+
     def mine_single_block(self):
         """Mine a single block using LunaLib"""
-        if not self.node:
+        node = self.node
+        if not node:
             self.add_log_message("Node not initialized", "error")
             return
 
-        success, message = self.node.mine_single_block()
-        msg_type = "success" if success else "warning"
-        self.add_log_message(message, msg_type)
+        def _report(result):
+            success, message = result
+            msg_type = "success" if success else "warning"
+            self.add_log_message(message, msg_type)
+
+        self._submit_action(node.mine_single_block, _report)
+
+    def sync_network(self):
+        """Sync with the network in the background"""
+        node = self.node
+        if not node:
+            self.add_log_message("Node not initialized", "error")
+            return
+
+        progress_bar = ft.ProgressBar(value=0, width=360, color=_CLR_ACCENT)
+        progress_text = ft.Text("Starting network sync...", size=12, color=_CLR_FG)
+        dialog = ft.AlertDialog(
+            title=ft.Text("Network Sync"),
+            content=ft.Column([progress_text, progress_bar], tight=True, spacing=10),
+        )
+        self._progress_widgets = (progress_bar, progress_text)
+        # node.sync_network() logs its outcome and refreshes history itself
+        future = self._submit_action(
+            functools.partial(node.sync_network, progress_callback=self._queue_progress),
+            lambda _result: None,
+        )
+        if future is None:
+            self._progress_widgets = None
+            return
+        self.page.dialog = dialog
+        dialog.open = True
+        self._schedule_update()
+        # Close on success and on failure alike
+        future.add_done_callback(lambda _f: self._post(self._finish_sync_progress, dialog))
+
+    def _finish_sync_progress(self, dialog):
+        self._progress_widgets = None
+        try:
+            while True:
+                self._progress_queue.get_nowait()
+        except queue.Empty:
+            pass
+        self.close_progress_dialog(dialog)
+
+    def _queue_progress(self, progress, message):
+        """progress_callback for worker threads: enqueue instead of hopping to the UI"""
+        self._progress_queue.put_nowait((progress, message))
+        self._mark_dirty("progress", delay=0.1)
+
+    def _apply_queued_progress(self):
+        """Drain queued progress and show only the newest entry"""
+        latest = None
+        try:
+            while True:
+                latest = self._progress_queue.get_nowait()
+        except queue.Empty:
+            pass
+        widgets = self._progress_widgets
+        if latest is None or not widgets:
+            return
+        progress_bar, progress_text = widgets
+        self.update_progress(progress_bar, progress_text, *latest)
                 
 
     def update_progress(self, progress_bar, progress_text, progress, message):
         """Update progress dialog"""
         progress_bar.value = progress / 100
         progress_text.value = message
-        self.page.update()
+        self.safe_page_update()
         
     def close_progress_dialog(self, dialog):
         """Close progress dialog"""
         dialog.open = False
-        self.page.update()
+        self._schedule_update()
             
     def save_settings(self):
         """Save all settings"""
@@ -871,45 +1293,35 @@ class LunaNodeApp:
         
     def update_history_content(self):
         """Update history content"""
-        def _refresh():
-            self.mining_history.update_history_content()
-            if self.node and self.main_page:
-                try:
-                    self.main_page.update_mining_stats()
-                except Exception:
-                    pass
-            if self.node and self.sidebar:
-                try:
-                    status = self.node.get_status()
-                    self.sidebar.update_status(status)
-                except Exception:
-                    pass
-            if self.bills_page:
-                try:
-                    self.bills_page.update_bills_content()
-                except Exception:
-                    pass
-        self.safe_run_thread(_refresh)
+        self._mark_dirty("history", "main", "sidebar", "bills")
         
     def show_about_dialog(self):
         """Show about dialog using sliding overlay"""
+        overlay_container = self._about_overlay
+        if overlay_container is not None:
+            # Static content: reuse the tree, only re-fit and slide back in
+            overlay_container.width = self.page.width - 240
+            overlay_container.height = self.page.height
+            overlay_container.left = 240
+            overlay_container.visible = True
+            self._schedule_update()
+            return
         overlay_container = ft.Container(
             width=self.page.width - 240,
             height=self.page.height,
             left=240,
             top=0,
-            bgcolor="#0f1a2a",
-            border=ft.border.only(left=ft.BorderSide(4, "#1e3a5c")),
+            bgcolor=_CLR_PANEL_BG,
+            border=ft.border.only(left=ft.BorderSide(4, _CLR_DIVIDER)),
             animate_position=ft.Animation(300, "easeOut"),
             padding=20,
         )
+        overlay_container.on_animation_end = lambda e: self._hide_about_overlay(overlay_container)
         
         def close_dialog(e):
+            # Slide out; on_animation_end hides it once the animation finishes
             overlay_container.left = self.page.width
-            self.page.update()
-            time.sleep(0.3)
-            self.page.overlay.remove(overlay_container)
-            self.page.update()
+            self._schedule_update()
         
         dialog_content = ft.Column([
             ft.Row([
@@ -919,33 +1331,33 @@ class LunaNodeApp:
                         width=32,
                         height=32,
                         fit=ft.ImageFit.CONTAIN,
-                        color="#00a1ff",
+                        color=_CLR_ACCENT,
                         color_blend_mode=ft.BlendMode.SRC_IN,
                         error_content=ft.Text("LN", size=20)
                     ),
                     margin=ft.margin.only(right=12),
                 ),
-                ft.Text("About Luna Node", size=24, color="#00a1ff", weight="bold"),
+                ft.Text("About Luna Node", size=24, color=_CLR_ACCENT, weight="bold"),
             ], alignment=ft.MainAxisAlignment.START),
             ft.Container(height=30),
-            ft.Text("Luna Node Miner", size=18, color="#e3f2fd"),
-            ft.Text("Version 1.0", size=14, color="#e3f2fd"),
-            ft.Text("A lightweight blockchain node for Luna Network", size=14, color="#e3f2fd"),
-            ft.Text("Optimized for fast startup and low memory usage", size=12, color="#e3f2fd"),
+            ft.Text("Luna Node Miner", size=18, color=_CLR_FG),
+            ft.Text("Version 1.0", size=14, color=_CLR_FG),
+            ft.Text("A lightweight blockchain node for Luna Network", size=14, color=_CLR_FG),
+            ft.Text("Optimized for fast startup and low memory usage", size=12, color=_CLR_FG),
             ft.Container(height=20),
-            ft.Text("Features:", size=16, color="#e3f2fd", weight="bold"),
-            ft.Text("• Fast blockchain synchronization", size=12, color="#e3f2fd"),
-            ft.Text("• Optimized memory usage", size=12, color="#e3f2fd"),
-            ft.Text("• Real-time mining statistics", size=12, color="#e3f2fd"),
-            ft.Text("• System tray integration", size=12, color="#e3f2fd"),
-            ft.Text("• Data persistence in ./data/ directory", size=12, color="#e3f2fd"),
+            ft.Text("Features:", size=16, color=_CLR_FG, weight="bold"),
+            ft.Text("• Fast blockchain synchronization", size=12, color=_CLR_FG),
+            ft.Text("• Optimized memory usage", size=12, color=_CLR_FG),
+            ft.Text("• Real-time mining statistics", size=12, color=_CLR_FG),
+            ft.Text("• System tray integration", size=12, color=_CLR_FG),
+            ft.Text("• Data persistence in ./data/ directory", size=12, color=_CLR_FG),
             ft.Container(height=40),
             ft.Button(
                 "Close",
                 on_click=close_dialog,
                 style=ft.ButtonStyle(
                     color="#ffffff",
-                    bgcolor="#00a1ff",
+                    bgcolor=_CLR_ACCENT,
                     padding=ft.padding.symmetric(horizontal=20, vertical=12),
                     shape=ft.RoundedRectangleBorder(radius=4)
                 )
@@ -953,8 +1365,16 @@ class LunaNodeApp:
         ], scroll=ft.ScrollMode.ADAPTIVE, horizontal_alignment=ft.CrossAxisAlignment.CENTER)
         
         overlay_container.content = dialog_content
+        self._about_overlay = overlay_container
         self.page.overlay.append(overlay_container)
-        self.page.update()
+        self._schedule_update()
+
+    def _hide_about_overlay(self, overlay_container):
+        # Slide-in finished, or reopened during the slide-out
+        if overlay_container.left == 240:
+            return
+        overlay_container.visible = False
+        self._schedule_update()
 
 
 def main(page: ft.Page):
@@ -963,7 +1383,7 @@ def main(page: ft.Page):
         app = LunaNodeApp()
         print("LunaNodeApp created")
         app.create_main_ui(page)
-        print("[DEBUG] create_main_ui completed")
+        _log.debug("create_main_ui completed")
         # Bills UI is loaded lazily on tab selection
     except Exception as e:
         import traceback
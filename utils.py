@@ -8,22 +8,51 @@ try:
     import certifi
 except Exception:
     certifi = None
+try:
+    import orjson
+except Exception:
+    orjson = None
 import sys
+import atexit
+import logging
+import logging.handlers
 from typing import Dict, List, Optional, Tuple
-from datetime import datetime
 import threading
+import queue
 import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+
+# Shared genesis/empty previous-hash value
+_ZERO_HASH = "0" * 64
+# Node answers that reject the block itself (resubmitting the same block cannot succeed)
+_SUBMIT_REJECT_MARKERS = (
+    "invalid",
+    "stale",
+    "rejected",
+    "orphan",
+    "already exists",
+    "previous hash",
+    "prev hash",
+    "difficulty",
+    "mismatch",
+)
+# ...unless the text is really a transport/server/encoding failure ("invalid JSON response", "HTTP 503")
+_SUBMIT_TRANSPORT_MARKERS = ("timeout", "timed out", "connection", "gzip", "encod", "json", "502", "503", "504")
 
 # Force UTF-8 console to avoid charmap errors from emoji output
 os.environ.setdefault("PYTHONUTF8", "1")
 os.environ.setdefault("PYTHONIOENCODING", "utf-8")
-try:
-    if hasattr(sys.stdout, "reconfigure"):
-        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
-    if hasattr(sys.stderr, "reconfigure"):
-        sys.stderr.reconfigure(encoding="utf-8", errors="replace")
-except Exception:
-    pass
+# Once per process (main.py runs the same block; see _lunanode_utf8_ready)
+if not getattr(sys, "_lunanode_utf8_ready", False):
+    try:
+        if hasattr(sys.stdout, "reconfigure"):
+            sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+        if hasattr(sys.stderr, "reconfigure"):
+            sys.stderr.reconfigure(encoding="utf-8", errors="replace")
+    except Exception:
+        pass
+    sys._lunanode_utf8_ready = True
 
 if certifi:
     try:
@@ -99,12 +128,48 @@ def _requests_verify_value():
         return certifi.where()
     return True
 
+def _dumps_json_bytes(data) -> bytes:
+    """Compact UTF-8 JSON for machine-only files (orjson when available)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+        except Exception:
+            pass
+    return json.dumps(data, separators=(',', ':'), default=str, ensure_ascii=False).encode("utf-8")
+
+def _loads_json_bytes(raw: bytes):
+    """Decode a JSON response body (orjson when available)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except Exception:
+            pass
+    return json.loads(raw)
+
 def _build_requests_session():
     session = requests.Session()
     try:
         session.verify = _requests_verify_value()
     except Exception:
         pass
+    # Keep-alive pool + idempotent-request retries (POST is not retried)
+    try:
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+    except Exception:
+        pass
     return session
 
 class _HTTPBlockchainManager:
@@ -304,6 +369,26 @@ def safe_print(*args, **kwargs):
     except Exception:
         pass
 
+# --- マイニング経路のデバッグ出力 ---
+# Records are enqueued and written by a background listener, and formatting is
+# deferred (%-style args), so the mining/submit path never blocks on stdout.
+# LUNANODE_DEBUG_LOG=1 enables the DEBUG records.
+_debug_log = logging.getLogger("lunanode")
+
+def _init_debug_log():
+    if _debug_log.handlers:
+        return
+    debug_on = str(os.getenv("LUNANODE_DEBUG_LOG", "0")).strip() == "1"
+    _debug_log.setLevel(logging.DEBUG if debug_on else logging.INFO)
+    _debug_log.propagate = False
+    log_q = queue.Queue(-1)
+    _debug_log.addHandler(logging.handlers.QueueHandler(log_q))
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_q, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
 # --- ハッシュアルゴリズム名の正規化 ---
 def _normalize_hash_algo(algo: str) -> str:
     """ハッシュアルゴリズム名を正規化（例: 'SHA256', 'sha256', 'SM3' → 'sha256' or 'sm3'）"""
@@ -351,17 +436,25 @@ def compute_sm3_hexdigest(data: bytes) -> str:
         return LUNALIB_SM3_FUNC(data)
     raise RuntimeError("SM3 hash function is not available in this LunaLib version.")
 
+# (epoch second, formatted) shared by the event loggers below
+_last_ts = [0, ""]
+
+def _event_timestamp() -> str:
+    """Wall-clock timestamp string, recomputed at most once per second"""
+    now_s = int(time.time())
+    if now_s != _last_ts[0]:
+        _last_ts[0] = now_s
+        _last_ts[1] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now_s))
+    return _last_ts[1]
+
 def log_cpu_mining_event(event: str, data: dict = None):
     """追跡用: CPUマイニングの詳細イベントをlogs/cpu_mining.logへ追記"""
-    import os
-    import json
-    from datetime import datetime
     log_dir = os.path.join(get_app_data_dir(), "logs")
     os.makedirs(log_dir, exist_ok=True)
     log_file = os.path.join(log_dir, "cpu_mining.log")
     try:
         entry = {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": _event_timestamp(),
             "event": event,
             "data": data or {}
         }
@@ -375,15 +468,12 @@ def log_cpu_mining_event(event: str, data: dict = None):
 
 def log_mining_debug_event(event: str, data: dict = None, scope: str = "mining"):
     """追跡用: CUDA/検証/送信イベントをlogs/mining_debug.logへ追記"""
-    import os
-    import json
-    from datetime import datetime
     log_dir = os.path.join(get_app_data_dir(), "logs")
     os.makedirs(log_dir, exist_ok=True)
     log_file = os.path.join(log_dir, "mining_debug.log")
     try:
         entry = {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": _event_timestamp(),
             "scope": scope,
             "event": event,
             "data": data or {},
@@ -408,13 +498,15 @@ class DataManager:
         self.mempool_cache_file = os.path.join(self.data_dir, "mempool_cache.json")
         self.logs_file = os.path.join(self.data_dir, "logs.json")
         self.stats_cache_file = os.path.join(self.data_dir, "stats_cache.json")
+        # index -> block view of blockchain_cache.json, keyed on (st_mtime_ns, st_size)
+        self._block_index: Dict[int, Dict] = {}
+        self._block_index_key: Optional[Tuple[int, int]] = None
         
         self.ensure_data_directory()
     
     def ensure_data_directory(self):
         """Create data directory if it doesn't exist"""
-        if not os.path.exists(self.data_dir):
-            os.makedirs(self.data_dir)
+        os.makedirs(self.data_dir, exist_ok=True)
     
     def save_settings(self, settings: Dict):
         """Save settings to file"""
@@ -429,9 +521,10 @@ class DataManager:
     def load_settings(self) -> Dict:
         """Load settings from file"""
         try:
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            with open(self.settings_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error loading settings: {e}")
         return {
@@ -456,8 +549,8 @@ class DataManager:
     def save_mining_history(self, history: List[Dict]):
         """Save mining history to file"""
         try:
-            with open(self.mining_history_file, 'w', encoding='utf-8') as f:
-                json.dump(history, f, indent=2, default=str, ensure_ascii=False)
+            with open(self.mining_history_file, 'wb') as f:
+                f.write(_dumps_json_bytes(history))
             return True
         except Exception as e:
             print(f"Error saving mining history: {e}")
@@ -466,14 +559,15 @@ class DataManager:
     def load_mining_history(self) -> List[Dict]:
         """Load mining history from file"""
         try:
-            if os.path.exists(self.mining_history_file):
-                with open(self.mining_history_file, 'r', encoding='utf-8') as f:
-                    history = json.load(f)
-                    # Check if the loaded history contains stringified JSON
-                    if isinstance(history, str):
-                        history = json.loads(history)
-                    print("[DEBUG] DataManager.load_mining_history: Loaded history:", history)
-                    return history
+            with open(self.mining_history_file, 'r', encoding='utf-8') as f:
+                history = json.load(f)
+                # Check if the loaded history contains stringified JSON
+                if isinstance(history, str):
+                    history = json.loads(history)
+                print("[DEBUG] DataManager.load_mining_history: Loaded history:", history)
+                return history
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error loading mining history: {e}")
         return []
@@ -481,8 +575,10 @@ class DataManager:
     def save_blockchain_cache(self, blockchain: List[Dict]):
         """Save blockchain cache to file"""
         try:
-            with open(self.blockchain_cache_file, 'w', encoding='utf-8') as f:
-                json.dump(blockchain, f, indent=2, default=str, ensure_ascii=False)
+            with open(self.blockchain_cache_file, 'wb') as f:
+                f.write(_dumps_json_bytes(blockchain))
+            # Our own write: rebuild the index even if mtime/size did not move
+            self._block_index_key = None
             return True
         except Exception as e:
             print(f"Error saving blockchain cache: {e}")
@@ -491,13 +587,44 @@ class DataManager:
     def load_blockchain_cache(self) -> List[Dict]:
         """Load blockchain cache from file"""
         try:
-            if os.path.exists(self.blockchain_cache_file):
-                with open(self.blockchain_cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            with open(self.blockchain_cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error loading blockchain cache: {e}")
         return []
 
+    def _get_block_index(self) -> Dict[int, Dict]:
+        """Return cached blocks keyed by index, reparsing only when the file changes"""
+        try:
+            st = os.stat(self.blockchain_cache_file)
+        except OSError:
+            self._block_index = {}
+            self._block_index_key = None
+            return self._block_index
+        # Size catches rewrites that land within the filesystem's mtime resolution
+        key = (st.st_mtime_ns, st.st_size)
+        if key != self._block_index_key:
+            index = {}
+            cache = self.load_blockchain_cache()
+            if isinstance(cache, list):
+                for block in cache:
+                    if isinstance(block, dict) and block.get("index") is not None:
+                        index[block.get("index")] = block
+            self._block_index = index
+            self._block_index_key = key
+        return self._block_index
+
+    def get_cached_block(self, block_index: int) -> Optional[Dict]:
+        """Look up a single cached block by index"""
+        return self._get_block_index().get(block_index)
+
+    def get_cached_blocks(self, indices: List[int]) -> Dict[int, Dict]:
+        """Look up several cached blocks by index"""
+        index = self._get_block_index()
+        return {i: index[i] for i in indices if i in index}
+
     def save_submitted_block(self, block_data: Dict) -> bool:
         """Upsert a submitted block into blockchain cache"""
         try:
@@ -516,8 +643,8 @@ class DataManager:
     def save_mempool_cache(self, mempool: List[Dict]):
         """Save mempool cache to file"""
         try:
-            with open(self.mempool_cache_file, 'w', encoding='utf-8') as f:
-                json.dump(mempool, f, indent=2, default=str, ensure_ascii=False)
+            with open(self.mempool_cache_file, 'wb') as f:
+                f.write(_dumps_json_bytes(mempool))
             return True
         except Exception as e:
             print(f"Error saving mempool cache: {e}")
@@ -526,9 +653,10 @@ class DataManager:
     def load_mempool_cache(self) -> List[Dict]:
         """Load mempool cache from file"""
         try:
-            if os.path.exists(self.mempool_cache_file):
-                with open(self.mempool_cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            with open(self.mempool_cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error loading mempool cache: {e}")
         return []
@@ -536,8 +664,8 @@ class DataManager:
     def save_logs(self, logs: List[Dict]):
         """Save logs to file"""
         try:
-            with open(self.logs_file, 'w', encoding='utf-8') as f:
-                json.dump(logs, f, indent=2, default=str, ensure_ascii=False)
+            with open(self.logs_file, 'wb') as f:
+                f.write(_dumps_json_bytes(logs))
             return True
         except Exception as e:
             print(f"Error saving logs: {e}")
@@ -563,13 +691,14 @@ class DataManager:
             }
         ]
         try:
-            if os.path.exists(self.logs_file):
-                with open(self.logs_file, 'r', encoding='utf-8') as f:
-                    logs = json.load(f)
-                    print("[DEBUG] DataManager.load_logs: Loaded logs:", logs)
-                    print("[DEBUG] DataManager.load_logs: Type of logs:", type(logs))
-                    if logs:
-                        return logs
+            with open(self.logs_file, 'r', encoding='utf-8') as f:
+                logs = json.load(f)
+                print("[DEBUG] DataManager.load_logs: Loaded logs:", logs)
+                print("[DEBUG] DataManager.load_logs: Type of logs:", type(logs))
+                if logs:
+                    return logs
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error loading logs: {e}")
         return default_logs
@@ -577,8 +706,8 @@ class DataManager:
     def save_stats(self, stats: Dict) -> bool:
         """Save latest stats snapshot to cache"""
         try:
-            with open(self.stats_cache_file, 'w', encoding='utf-8') as f:
-                json.dump(stats, f, indent=2, default=str, ensure_ascii=False)
+            with open(self.stats_cache_file, 'wb') as f:
+                f.write(_dumps_json_bytes(stats))
             return True
         except Exception as e:
             print(f"Error saving stats cache: {e}")
@@ -587,10 +716,11 @@ class DataManager:
     def load_stats(self) -> Dict:
         """Load latest stats snapshot from cache"""
         try:
-            if os.path.exists(self.stats_cache_file):
-                with open(self.stats_cache_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data if isinstance(data, dict) else {}
+            with open(self.stats_cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error loading stats cache: {e}")
         return {}
@@ -607,7 +737,7 @@ class NodeConfig:
     def load_from_storage(self):
         """Load configuration from storage"""
         settings = self.data_manager.load_settings()
-        print("[DEBUG] NodeConfig.load_from_storage: Loaded settings:", settings)
+        _debug_log.debug("[DEBUG] NodeConfig.load_from_storage: Loaded settings: %s", settings)
         self.miner_address = settings.get('miner_address', "LUN_Node_Miner_Default")
         self.difficulty = settings.get('difficulty', 2)
         self.auto_mine = settings.get('auto_mine', False)
@@ -629,6 +759,9 @@ class NodeConfig:
         self.cuda_sm3_kernel = settings.get('cuda_sm3_kernel', True)
         self.cpu_threads = settings.get('cpu_threads', 1)
         self.gpu_batch_size = settings.get('gpu_batch_size', 100000)
+        # Live stats polling bounds (seconds) while mining on the Mining tab
+        self.status_poll_min_interval = settings.get('status_poll_min_interval', 1.0)
+        self.status_poll_max_interval = settings.get('status_poll_max_interval', 5.0)
     
     def save_to_storage(self):
         """Save configuration to storage"""
@@ -654,11 +787,18 @@ class NodeConfig:
             'cuda_sm3_kernel': getattr(self, 'cuda_sm3_kernel', True),
             'cpu_threads': getattr(self, 'cpu_threads', 1),
             'gpu_batch_size': getattr(self, 'gpu_batch_size', 100000),
+            'status_poll_min_interval': self.status_poll_min_interval,
+            'status_poll_max_interval': self.status_poll_max_interval,
         }
         return self.data_manager.save_settings(settings)
 
 class LunaNode:
     """Main Luna Node class using lunalib directly"""
+
+    # Ring-buffer size for in-memory/persisted application logs
+    MAX_LOG_ENTRIES = 1000
+    # Cap on non-success mining records kept in merged/persisted history
+    MAX_FAILED_HISTORY = 10000
     
     def __init__(self, cuda_available: bool = False,
                  log_callback=None,
@@ -673,7 +813,11 @@ class LunaNode:
             pass
         
         self.cuda_available = cuda_available
+        # Listener thread starts with the node, not at import (env setup may still be running)
+        _init_debug_log()
         self.data_manager = DataManager()
+        # Shared keep-alive session for direct node API calls
+        self._http_session = _build_requests_session()
         print("[DEBUG] LunaNode.__init__: DataManager instance:", self.data_manager)
         
         # Store callbacks
@@ -692,7 +836,18 @@ class LunaNode:
         print("[DEBUG] LunaNode.__init__: Type of self.data_manager after initialization:", type(self.data_manager))
         print("[DEBUG] LunaNode.__init__: Value of self.data_manager after initialization:", self.data_manager)
         
-        self.logs = self.data_manager.load_logs()
+        # Bounded in-memory log buffer (oldest entries drop off automatically)
+        loaded_logs = self.data_manager.load_logs()
+        self.logs = deque(loaded_logs if isinstance(loaded_logs, list) else [], maxlen=self.MAX_LOG_ENTRIES)
+        # Log persistence is coalesced: at most one logs.json rewrite per interval
+        self._log_flush_interval = float(os.getenv("LUNANODE_LOG_FLUSH_INTERVAL", "2"))
+        self._log_flush_lock = threading.Lock()
+        self._log_dirty = False
+        self._last_log_flush = 0.0
+        self._flush_stop_event = threading.Event()
+        self._flush_thread = None
+        # Config writes from setters are coalesced by the same flusher
+        self._config_dirty = False
         
         self.config = NodeConfig(self.data_manager)
         print("[DEBUG] LunaNode.__init__: NodeConfig instance:", self.config)
@@ -758,6 +913,7 @@ class LunaNode:
         self._gpu_batch_warmup = True
         self._startup_ts = time.time()
         self._last_mined_ts = 0.0
+        self._last_reward_sync_ts = 0.0
 
         # Fast-start mining (temporary difficulty override for first block)
         self._fast_start_applied = False
@@ -768,12 +924,50 @@ class LunaNode:
         self._last_submitted_index = None
         self._last_submitted_ts = 0.0
         self._last_submitted_success = False
+        # Created on first local save, then reused
+        self._blocks_dir = None
         
         self.is_running = True
         self._stop_mining_event = threading.Event()
         self._submit_lock = threading.Lock()
+        # Worker pool for racing the primary and fallback submit endpoints
+        self._submit_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="lunanode-submit")
+        self._submit_race_delay = float(os.getenv("LUNANODE_SUBMIT_RACE_DELAY", "2.0"))
+        # Blocks handed over by miner callbacks are submitted off the mining thread
+        self._submit_q = queue.Queue(maxsize=64)
+        self._submit_thread = None
+        self._submit_thread_lock = threading.Lock()  # concurrent callbacks start one worker
+        self._submit_retry_delays = (0.5, 1.0)  # transient transport/gateway failures only
         self._sync_stop_event = threading.Event()
         self._sync_thread = None
+        self._start_persist_flusher()
+
+        # Short-lived memo of get_status() for UI polling
+        self._status_cache_ttl = float(os.getenv("LUNANODE_STATUS_TTL", "1.0"))
+        self._status_cache = None
+        self._status_cache_ts = 0.0
+        self._mining_aggregates_cache = None
+        # Merged mining history, reused while its sources look unchanged
+        self._history_cache = None
+        self._history_cache_sig = None
+        self._history_cache_ts = 0.0
+        # Constant part of the get_status() error result
+        self._error_status_template = {
+            'network_height': 0,
+            'network_difficulty': 1,
+            'previous_hash': _ZERO_HASH,
+            'total_transactions': 0,
+            'connection_status': 'error',
+            'p2p_connected': False,
+            'p2p_peers': 0,
+            'success_rate': 0,
+            'avg_mining_time': 0,
+            'current_hash_rate': 0,
+            'current_hash': '',
+            'current_nonce': 0,
+            'cuda_available': False,
+            'mining_method': 'CPU',
+        }
 
         # Network polling throttling
         self.net_poll_interval = float(os.getenv("LUNANODE_NET_POLL_INTERVAL", "20"))
@@ -788,54 +982,18 @@ class LunaNode:
         self.peers = []
         
         # Use LunaLib managers for blockchain management (fallback to HTTP when unavailable)
-        try:
-            log_mining_debug_event("init_step", {"step": "blockchain_manager_init"}, scope="app")
-        except Exception:
-            pass
-        self.blockchain_manager = None
-        if BlockchainManager:
-            try:
-                self.blockchain_manager = BlockchainManager(endpoint_url=self.config.node_url)
-            except Exception as e:
-                self.blockchain_manager = None
-                try:
-                    log_mining_debug_event("blockchain_manager_error", {"error": str(e)}, scope="app")
-                except Exception:
-                    pass
-        if not self.blockchain_manager:
-            try:
-                self.blockchain_manager = _HTTPBlockchainManager(self.config.node_url)
-                log_mining_debug_event("blockchain_manager_fallback", {"endpoint": self.config.node_url}, scope="app")
-            except Exception:
-                self.blockchain_manager = None
-        try:
-            log_mining_debug_event("init_step", {"step": "blockchain_manager_ready"}, scope="app")
-        except Exception:
-            pass
-        try:
-            log_mining_debug_event("init_step", {"step": "mempool_manager_init"}, scope="app")
-        except Exception:
-            pass
-        self.mempool_manager = None
-        if MempoolManager:
-            try:
-                self.mempool_manager = MempoolManager([self.config.node_url])
-            except Exception as e:
-                self.mempool_manager = None
-                try:
-                    log_mining_debug_event("mempool_manager_error", {"error": str(e)}, scope="app")
-                except Exception:
-                    pass
-        if not self.mempool_manager:
-            try:
-                self.mempool_manager = _HTTPMempoolManager([self.config.node_url])
-                log_mining_debug_event("mempool_manager_fallback", {"endpoint": self.config.node_url}, scope="app")
-            except Exception:
-                self.mempool_manager = None
-        try:
-            log_mining_debug_event("init_step", {"step": "mempool_manager_ready"}, scope="app")
-        except Exception:
-            pass
+        # The managers only depend on node_url: construct them concurrently
+        # so their network/disk probes overlap instead of running back to back
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="lunanode-init") as init_pool:
+            blockchain_future = init_pool.submit(self._create_blockchain_manager)
+            mempool_future = init_pool.submit(self._create_mempool_manager)
+            tx_future = init_pool.submit(self._create_tx_manager)
+            difficulty_future = init_pool.submit(DifficultySystem)
+        self.blockchain_manager = blockchain_future.result()
+        self.mempool_manager = mempool_future.result()
+        self.tx_manager = tx_future.result()
+        # Initialize DifficultySystem for reward calculation
+        self.difficulty_system = difficulty_future.result()
 
         # Link blockchain manager to mempool manager (if supported)
         try:
@@ -855,7 +1013,7 @@ class LunaNode:
                     transaction.setdefault("to", "unknown")
                     transaction.setdefault("amount", 0)
                     transaction.setdefault("timestamp", time.time())
-                    transaction.setdefault("hash", "0" * 64)
+                    transaction.setdefault("hash", _ZERO_HASH)
                     return True
                 self.mempool_manager._validate_transaction_basic = _validate_transaction_basic_safe
         except Exception:
@@ -877,7 +1035,8 @@ class LunaNode:
                 # Retry a couple times to reduce transient disconnects
                 for _ in range(2):
                     try:
-                        resp = self.blockchain_manager._session.get(
+                        session = getattr(self.blockchain_manager, "_session", None) or self._http_session
+                        resp = session.get(
                             f"{self.config.node_url}/blockchain/blocks",
                             timeout=10,
                         )
@@ -903,17 +1062,6 @@ class LunaNode:
         except Exception:
             pass
 
-        # Transaction manager (lunalib 2.x)
-        self.tx_manager = None
-        if TransactionManager:
-            try:
-                self.tx_manager = TransactionManager([self.config.node_url])
-            except Exception:
-                self.tx_manager = None
-
-        # Initialize DifficultySystem for reward calculation
-        self.difficulty_system = DifficultySystem()
-        
         # Optionally defer GPU init to avoid startup hangs in packaged builds
         self._gpu_init_deferred = False
         if os.getenv("LUNANODE_DISABLE_GPU_INIT", "0") == "1":
@@ -1257,7 +1405,7 @@ class LunaNode:
         cuda_manager = getattr(target_miner, "cuda_manager", None)
         if not cuda_manager:
             return
-        if getattr(self, "hash_algorithm", "sha256") != "sm3":
+        if self.hash_algorithm != "sm3":
             return
 
         has_kernel = False
@@ -1453,12 +1601,12 @@ class LunaNode:
             base = 1000
         dynamic = bool(getattr(self.config, "gpu_batch_dynamic", False))
 
-        warmup = bool(getattr(self, "_gpu_batch_warmup", False))
+        warmup = self._gpu_batch_warmup
         warmup_size = min(base, 20000)
 
         mempool_len = 0
         try:
-            cached = getattr(self, "_net_cache", {}).get("mempool", [])
+            cached = self._net_cache.get("mempool", [])
             if isinstance(cached, list):
                 mempool_len = len(cached)
         except Exception:
@@ -1538,7 +1686,7 @@ class LunaNode:
                     return compute_sm3_hexdigest(block_string.encode())
                 return hashlib.sha256(block_string.encode()).hexdigest()
             except Exception:
-                return "0" * 64
+                return _ZERO_HASH
 
         try:
             self.miner._calculate_block_hash = _calculate_block_hash
@@ -1617,10 +1765,113 @@ class LunaNode:
             return False
         return True
             
+    def _create_blockchain_manager(self):
+        """LunaLib BlockchainManager, falling back to the plain HTTP client"""
+        try:
+            log_mining_debug_event("init_step", {"step": "blockchain_manager_init"}, scope="app")
+        except Exception:
+            pass
+        manager = None
+        if BlockchainManager:
+            try:
+                manager = BlockchainManager(endpoint_url=self.config.node_url)
+            except Exception as e:
+                manager = None
+                try:
+                    log_mining_debug_event("blockchain_manager_error", {"error": str(e)}, scope="app")
+                except Exception:
+                    pass
+        if not manager:
+            try:
+                manager = _HTTPBlockchainManager(self.config.node_url)
+                log_mining_debug_event("blockchain_manager_fallback", {"endpoint": self.config.node_url}, scope="app")
+            except Exception:
+                manager = None
+        try:
+            log_mining_debug_event("init_step", {"step": "blockchain_manager_ready"}, scope="app")
+        except Exception:
+            pass
+        return manager
+
+    def _create_mempool_manager(self):
+        """LunaLib MempoolManager, falling back to the plain HTTP client"""
+        try:
+            log_mining_debug_event("init_step", {"step": "mempool_manager_init"}, scope="app")
+        except Exception:
+            pass
+        manager = None
+        if MempoolManager:
+            try:
+                manager = MempoolManager([self.config.node_url])
+            except Exception as e:
+                manager = None
+                try:
+                    log_mining_debug_event("mempool_manager_error", {"error": str(e)}, scope="app")
+                except Exception:
+                    pass
+        if not manager:
+            try:
+                manager = _HTTPMempoolManager([self.config.node_url])
+                log_mining_debug_event("mempool_manager_fallback", {"endpoint": self.config.node_url}, scope="app")
+            except Exception:
+                manager = None
+        try:
+            log_mining_debug_event("init_step", {"step": "mempool_manager_ready"}, scope="app")
+        except Exception:
+            pass
+        return manager
+
+    def _create_tx_manager(self):
+        """Transaction manager (lunalib 2.x)"""
+        if TransactionManager:
+            try:
+                return TransactionManager([self.config.node_url])
+            except Exception:
+                pass
+        return None
+
     def _on_block_mined(self, block_data: Dict):
-        """Handle newly mined block (manual mining path)"""
+        """Handle newly mined block (manual mining path) without blocking the miner"""
+        try:
+            self._submit_q.put_nowait(block_data)
+        except queue.Full:
+            # 64 blocks behind: the chain has moved on, this one would be stale anyway
+            self._log_message(f"Submit queue full; dropping block #{block_data.get('index')}", "warning")
+            return
+        with self._submit_thread_lock:
+            if not (self._submit_thread and self._submit_thread.is_alive()):
+                self._submit_thread = threading.Thread(target=self._submit_worker, daemon=True)
+                self._submit_thread.start()
+
+    def _submit_worker(self):
+        """Drain queued blocks; None is the shutdown sentinel"""
+        while True:
+            block_data = self._submit_q.get()
+            if block_data is None:
+                break
+            self._process_mined_block(block_data)
+
+    @staticmethod
+    def _is_transient_submit_error(message: str) -> bool:
+        msg = str(message or "")
+        return (
+            msg.startswith("Plain submit failed")
+            or msg.startswith(("HTTP 502", "HTTP 503", "HTTP 504"))
+            or msg == "Submission already in progress"
+        )
+
+    def _process_mined_block(self, block_data: Dict):
+        """Submit a mined block and update stats/callbacks"""
         try:
             success, message = self.submit_block(block_data)
+            for delay in self._submit_retry_delays:
+                if success or not self._is_transient_submit_error(message):
+                    break
+                log_mining_debug_event("submit_retry", {"block_index": block_data.get("index"), "delay": delay, "error": message}, scope="submit")
+                if self._flush_stop_event.wait(delay):
+                    break
+                # submit_block re-checks the chain tip, so a retry cannot submit a stale block
+                success, message = self.submit_block(block_data)
             if success:
                 self.stats['successful_blocks'] += 1
                 try:
@@ -1771,7 +2022,7 @@ class LunaNode:
     def _maybe_apply_fast_start_difficulty(self) -> None:
         """Temporarily lower difficulty for the first block to reduce initial wait time."""
         try:
-            if getattr(self, "_fast_start_applied", False):
+            if self._fast_start_applied:
                 return
             current = int(getattr(self.config, "difficulty", 0) or 0)
             if current <= 1:
@@ -1794,9 +2045,9 @@ class LunaNode:
     def _maybe_restore_difficulty_after_first_block(self) -> None:
         """Restore configured difficulty after the first successful block."""
         try:
-            if not getattr(self, "_fast_start_applied", False):
+            if not self._fast_start_applied:
                 return
-            original = getattr(self, "_fast_start_original_difficulty", None)
+            original = self._fast_start_original_difficulty
             if original is None:
                 return
             self.config.difficulty = int(original)
@@ -1972,7 +2223,7 @@ class LunaNode:
         """Backfill mining history from on-chain reward transactions when local cache is empty."""
         try:
             now_ts = time.time()
-            if not force and (now_ts - getattr(self, "_last_reward_sync_ts", 0)) < 60:
+            if not force and (now_ts - self._last_reward_sync_ts) < 60:
                 return
             self._last_reward_sync_ts = now_ts
             if not self.blockchain_manager:
@@ -2048,10 +2299,12 @@ class LunaNode:
         self.config.save_to_storage()
         return results
 
-    def sync_blockchain_cache(self, progress_callback=None, batch_size: int = 200) -> Dict:
+    def sync_blockchain_cache(self, progress_callback=None, batch_size: int = 200,
+                              latest_height: Optional[int] = None) -> Dict:
         """Warm lunalib blockchain cache using range API."""
         try:
-            latest_height = self.blockchain_manager.get_blockchain_height()
+            if latest_height is None:
+                latest_height = self.blockchain_manager.get_blockchain_height()
             if latest_height <= 0:
                 return {"success": True, "height": latest_height}
 
@@ -2081,22 +2334,63 @@ class LunaNode:
         message = sanitize_for_console(message)
 
         log_entry = {
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'timestamp': _event_timestamp(),
             'message': message,
             'type': msg_type
         }
-        safe_print(f"DEBUG: Log entry created: {log_entry}")
+        _debug_log.debug("DEBUG: Log entry created: %s", log_entry)
         self.logs.append(log_entry)
-        
-        if len(self.logs) > 1000:
-            self.logs.pop(0)
-            
-        self.data_manager.save_logs(self.logs)
-        safe_print("DEBUG: Logs saved to storage.")
+        self._log_dirty = True
+        if time.time() - self._last_log_flush >= self._log_flush_interval:
+            self._flush_logs()
             
         if self.log_callback:
             self.log_callback(message, msg_type)
-            safe_print("DEBUG: Log callback executed.")
+            _debug_log.debug("DEBUG: Log callback executed.")
+
+    def _flush_logs(self):
+        """Persist the log buffer if it changed since the last write"""
+        with self._log_flush_lock:
+            if not self._log_dirty:
+                return
+            self._log_dirty = False
+            self._last_log_flush = time.time()
+            self.data_manager.save_logs(list(self.logs))
+        _debug_log.debug("DEBUG: Logs saved to storage.")
+
+    def request_config_save(self):
+        """Mark config dirty; the background flusher writes it within ~0.5s"""
+        self._config_dirty = True
+
+    def _flush_config(self):
+        """Write config to storage if a setter marked it dirty"""
+        if not self._config_dirty:
+            return
+        self._config_dirty = False
+        try:
+            self.config.save_to_storage()
+        except Exception:
+            self._config_dirty = True
+
+    def _start_persist_flusher(self):
+        """Background flush for deferred config writes and trailing log lines"""
+        if self._flush_thread and self._flush_thread.is_alive():
+            return
+
+        def _flush_loop():
+            while not self._flush_stop_event.wait(0.5):
+                try:
+                    self._flush_config()
+                except Exception:
+                    pass
+                try:
+                    if time.time() - self._last_log_flush >= self._log_flush_interval:
+                        self._flush_logs()
+                except Exception:
+                    pass
+
+        self._flush_thread = threading.Thread(target=_flush_loop, daemon=True)
+        self._flush_thread.start()
 
     def _recalculate_reward_stats(self):
         try:
@@ -2123,44 +2417,71 @@ class LunaNode:
             return True
         return False
 
-    def _calculate_mining_totals(self) -> Tuple[int, int, float]:
-        """Calculate blocks mined, empty blocks, and total rewards from mining history."""
-        try:
-            history = self.get_mining_history()
-            success_records = [r for r in history if self._is_success_record(r)]
-            empty_blocks_mined = 0
-            for record in success_records:
-                if record.get("is_empty_block") is True:
+    def _mining_aggregates(self, history: List[Dict]) -> Dict:
+        """Blocks/empty/reward/time totals for merged history, memoized on its shape."""
+        head = history[0] if history else None
+        if isinstance(head, dict):
+            signature = (len(history), head.get("block_index"), head.get("hash"), head.get("timestamp"))
+        else:
+            signature = (len(history),)
+        cached = self._mining_aggregates_cache
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        blocks_mined = 0
+        empty_blocks_mined = 0
+        total_reward = 0.0
+        total_mining_time = 0.0
+        for record in history:
+            try:
+                total_mining_time += record.get('mining_time', 0)
+            except Exception:
+                pass
+            if not self._is_success_record(record):
+                continue
+            blocks_mined += 1
+            txs = record.get("transactions")
+            if record.get("is_empty_block") is True:
+                empty_blocks_mined += 1
+            elif isinstance(txs, list):
+                non_reward = [
+                    tx
+                    for tx in txs
+                    if isinstance(tx, dict) and str(tx.get("type", "")).lower() not in ("reward", "mining_reward")
+                ]
+                if len(non_reward) == 0:
                     empty_blocks_mined += 1
-                    continue
-                txs = record.get("transactions")
-                if isinstance(txs, list):
-                    non_reward = [
-                        tx
-                        for tx in txs
-                        if isinstance(tx, dict) and str(tx.get("type", "")).lower() not in ("reward", "mining_reward")
-                    ]
-                    if len(non_reward) == 0:
-                        empty_blocks_mined += 1
-            total_reward = 0.0
-            for record in success_records:
-                reward = record.get("reward")
-                if reward is None and isinstance(record.get("transactions"), list):
-                    try:
-                        reward = next(
-                            (tx.get("amount") for tx in record.get("transactions", [])
-                             if isinstance(tx, dict) and str(tx.get("type", "")).lower() in ("reward", "mining_reward")),
-                            0.0,
-                        )
-                    except Exception:
-                        reward = 0.0
-                if reward is None:
-                    reward = 0.0
+            reward = record.get("reward")
+            if reward is None and isinstance(txs, list):
                 try:
-                    total_reward += float(reward)
+                    reward = next(
+                        (tx.get("amount") for tx in txs
+                         if isinstance(tx, dict) and str(tx.get("type", "")).lower() in ("reward", "mining_reward")),
+                        0.0,
+                    )
                 except Exception:
-                    pass
-            return len(success_records), empty_blocks_mined, total_reward
+                    reward = 0.0
+            if reward is None:
+                reward = 0.0
+            try:
+                total_reward += float(reward)
+            except Exception:
+                pass
+
+        totals = {
+            "blocks_mined": blocks_mined,
+            "empty_blocks_mined": empty_blocks_mined,
+            "total_reward": total_reward,
+            "total_mining_time": total_mining_time,
+        }
+        self._mining_aggregates_cache = (signature, totals)
+        return totals
+
+    def _calculate_mining_totals(self) -> Tuple[int, int, float]:
+        """Calculate blocks mined, empty blocks, and total rewards from mining history."""
+        try:
+            totals = self._mining_aggregates(self.get_mining_history())
+            return totals["blocks_mined"], totals["empty_blocks_mined"], totals["total_reward"]
         except Exception:
             return 0, 0, 0.0
 
@@ -2186,7 +2507,7 @@ class LunaNode:
             'network_height': 0,
             'network_difficulty': 1,
             'mining_difficulty': self.config.difficulty,
-            'previous_hash': '0' * 64,
+            'previous_hash': _ZERO_HASH,
             'miner_address': self.config.miner_address,
             'blocks_mined': self.miner.blocks_mined,
             'auto_mining': self._is_mining_active(),
@@ -2282,14 +2603,33 @@ class LunaNode:
         """Switch from cached stats to live stats"""
         self._prefer_cached_stats = False
     
-    def get_status(self) -> Dict:
+    def _invalidate_status_cache(self):
+        """Force the next get_status() to rebuild"""
+        self._status_cache = None
+
+    def get_status(self, ttl: Optional[float] = None) -> Dict:
+        """Get node status; repeated polls within ``ttl`` seconds reuse the last result (0 = fresh)"""
+        if ttl is None:
+            ttl = self._status_cache_ttl
+        cached = self._status_cache
+        if cached is not None and ttl > 0 and time.monotonic() - self._status_cache_ts < ttl:
+            return dict(cached)
+        status = self._build_status()
+        if isinstance(status, dict) and 'error' not in status:
+            self._status_cache = dict(status)
+            # Stamped after the build so the snapshot's age excludes query time
+            self._status_cache_ts = time.monotonic()
+        return status
+
+    def _build_status(self) -> Dict:
         """Get node status, preferring P2P for blocks/mempool if peers are available"""
         try:
+            stats = self.stats
             disable_cache = os.getenv("LUNANODE_DISABLE_STATS_CACHE", "0") == "1"
             fast_startup = os.getenv("LUNANODE_FAST_STARTUP", "0") == "1"
             now_ts = time.time()
-            recent_mine = (now_ts - getattr(self, "_last_mined_ts", 0)) < 30
-            if not disable_cache and fast_startup and (time.time() - getattr(self, "_startup_ts", 0)) < 30 and not recent_mine:
+            recent_mine = (now_ts - self._last_mined_ts) < 30
+            if not disable_cache and fast_startup and (time.time() - self._startup_ts) < 30 and not recent_mine:
                 cached = self._cached_status or self.data_manager.load_stats()
                 if isinstance(cached, dict) and cached:
                     cached = self._apply_mining_totals_to_status(cached, save_cache=True)
@@ -2349,38 +2689,13 @@ class LunaNode:
             except Exception:
                 pass
             merged_history = self.get_mining_history()
-            success_records = [r for r in merged_history if self._is_success_record(r)]
-            empty_blocks_mined = 0
-            for record in success_records:
-                if record.get("is_empty_block") is True:
-                    empty_blocks_mined += 1
-                    continue
-                txs = record.get("transactions")
-                if isinstance(txs, list):
-                    non_reward = [tx for tx in txs if isinstance(tx, dict) and str(tx.get("type", "")).lower() not in ("reward", "mining_reward")]
-                    if len(non_reward) == 0:
-                        empty_blocks_mined += 1
-            total_mining_time = sum(record.get('mining_time', 0) for record in merged_history)
-            avg_mining_time = total_mining_time / len(merged_history) if merged_history else 0
-            blocks_mined = len(success_records)
-            total_reward = 0.0
-            for record in success_records:
-                reward = record.get("reward")
-                if reward is None and isinstance(record.get("transactions"), list):
-                    try:
-                        reward = next(
-                            (tx.get("amount") for tx in record.get("transactions", [])
-                             if isinstance(tx, dict) and str(tx.get("type", "")).lower() in ("reward", "mining_reward")),
-                            0.0,
-                        )
-                    except Exception:
-                        reward = 0.0
-                if reward is None:
-                    reward = 0.0
-                try:
-                    total_reward += float(reward)
-                except Exception:
-                    pass
+            hist_len = len(merged_history)
+            totals = self._mining_aggregates(merged_history)
+            empty_blocks_mined = totals["empty_blocks_mined"]
+            total_mining_time = totals["total_mining_time"]
+            avg_mining_time = total_mining_time / hist_len if hist_len else 0
+            blocks_mined = totals["blocks_mined"]
+            total_reward = totals["total_reward"]
             try:
                 self.miner.blocks_mined = blocks_mined
                 self.miner.total_reward = total_reward
@@ -2413,7 +2728,7 @@ class LunaNode:
                     gpu_hash_rate = 0.0
             if not gpu_hash_rate:
                 try:
-                    gpu_hash_rate = float(self.stats.get('cuda_hash_rate', 0) or 0)
+                    gpu_hash_rate = float(stats.get('cuda_hash_rate', 0) or 0)
                 except Exception:
                     gpu_hash_rate = 0.0
             if not gpu_hash_rate and self.gpu_miner:
@@ -2434,10 +2749,10 @@ class LunaNode:
                 except Exception:
                     gpu_hash_rate = 0.0
 
-            if using_cuda and (self.stats.get('cuda_hash_rate', 0) > 0 or gpu_stats):
-                current_hash_rate = gpu_stats.get('hash_rate', 0) or self.stats['cuda_hash_rate']
-                current_hash = gpu_stats.get('current_hash', '') or gpu_stats.get('hash', '') or self.stats.get('cuda_last_hash', '')
-                current_nonce = gpu_stats.get('current_nonce', 0) or gpu_stats.get('nonce', 0) or self.stats.get('cuda_last_nonce', 0)
+            if using_cuda and (stats.get('cuda_hash_rate', 0) > 0 or gpu_stats):
+                current_hash_rate = gpu_stats.get('hash_rate', 0) or stats['cuda_hash_rate']
+                current_hash = gpu_stats.get('current_hash', '') or gpu_stats.get('hash', '') or stats.get('cuda_last_hash', '')
+                current_nonce = gpu_stats.get('current_nonce', 0) or gpu_stats.get('nonce', 0) or stats.get('cuda_last_nonce', 0)
                 if not current_nonce and self.gpu_miner:
                     try:
                         current_nonce = int(
@@ -2464,22 +2779,22 @@ class LunaNode:
                 current_hash = mining_stats.get('current_hash', '')
                 current_nonce = mining_stats.get('current_nonce', 0)
                 if not current_hash_rate:
-                    current_hash_rate = getattr(self.miner, 'last_cpu_hashrate', 0) or getattr(self.miner, 'hash_rate', 0) or self.stats.get('cpu_hash_rate', 0)
+                    current_hash_rate = getattr(self.miner, 'last_cpu_hashrate', 0) or getattr(self.miner, 'hash_rate', 0) or stats.get('cpu_hash_rate', 0)
                 if not current_hash:
-                    current_hash = self.stats.get('cpu_last_hash', '')
+                    current_hash = stats.get('cpu_last_hash', '')
                 if not current_nonce:
                     try:
-                        current_nonce = int(self.stats.get('cpu_last_nonce', 0) or 0)
+                        current_nonce = int(stats.get('cpu_last_nonce', 0) or 0)
                     except Exception:
                         pass
             cpu_nonce = 0
             gpu_nonce = 0
             try:
-                cpu_nonce = int(self.stats.get('cpu_last_nonce', 0) or 0)
+                cpu_nonce = int(stats.get('cpu_last_nonce', 0) or 0)
             except Exception:
                 cpu_nonce = 0
             try:
-                gpu_nonce = int(self.stats.get('cuda_last_nonce', 0) or 0)
+                gpu_nonce = int(stats.get('cuda_last_nonce', 0) or 0)
             except Exception:
                 gpu_nonce = 0
             try:
@@ -2547,7 +2862,7 @@ class LunaNode:
                 except Exception:
                     pass
             try:
-                cpu_hash_rate = float(self.stats.get('cpu_hash_rate', 0) or 0)
+                cpu_hash_rate = float(stats.get('cpu_hash_rate', 0) or 0)
             except Exception:
                 cpu_hash_rate = 0.0
             try:
@@ -2561,11 +2876,22 @@ class LunaNode:
                 except Exception:
                     pass
             p2p_status = self.get_p2p_status()
+            if latest_block:
+                network_difficulty = latest_block.get('difficulty', 1)
+                previous_hash = latest_block.get('hash', _ZERO_HASH)
+            else:
+                network_difficulty = 1
+                previous_hash = _ZERO_HASH
+            # Count non-reward mempool transactions without building a temporary list
+            total_transactions = 0
+            for tx in mempool:
+                if isinstance(tx, dict) and str(tx.get("type") or "").lower() not in ("reward", "mining_reward"):
+                    total_transactions += 1
             status = {
                 'network_height': current_height,
-                'network_difficulty': latest_block.get('difficulty', 1) if latest_block else 1,
+                'network_difficulty': network_difficulty,
                 'mining_difficulty': self.config.difficulty,
-                'previous_hash': latest_block.get('hash', '0' * 64) if latest_block else '0' * 64,
+                'previous_hash': previous_hash,
                 'miner_address': self.config.miner_address,
                 'blocks_mined': blocks_mined,
                 'auto_mining': self._is_mining_active(),
@@ -2576,18 +2902,14 @@ class LunaNode:
                 'configured_difficulty': self.config.difficulty,
                 'total_reward': total_reward,
                 'empty_blocks_mined': empty_blocks_mined,
-                'total_transactions': len([
-                    tx
-                    for tx in mempool
-                    if isinstance(tx, dict) and str(tx.get("type") or "").lower() not in ("reward", "mining_reward")
-                ]),
+                'total_transactions': total_transactions,
                 'reward_transactions': blocks_mined,
                 'connection_status': 'connected' if current_height >= 0 else 'disconnected',
                 'p2p_connected': p2p_status.get('connected', False),
                 'p2p_peers': p2p_status.get('peers', 0),
-                'uptime': time.time() - self.stats['start_time'],
-                'total_mining_attempts': len(merged_history),
-                'success_rate': (self.stats['successful_blocks'] / len(merged_history)) * 100 if merged_history else 0,
+                'uptime': time.time() - stats['start_time'],
+                'total_mining_attempts': hist_len,
+                'success_rate': (stats['successful_blocks'] / hist_len) * 100 if hist_len else 0,
                 'avg_mining_time': avg_mining_time,
                 'current_hash_rate': current_hash_rate,
                 'current_hash': current_hash,
@@ -2612,33 +2934,21 @@ class LunaNode:
             status['hash_algorithm'] = self.hash_algorithm
             return status
         except Exception as e:
-            return {
-                'network_height': 0,
-                'network_difficulty': 1,
+            status = self._error_status_template.copy()
+            status.update({
                 'mining_difficulty': self.config.difficulty,
-                'previous_hash': '0' * 64,
                 'miner_address': self.config.miner_address,
                 'blocks_mined': self.miner.blocks_mined,
                 'auto_mining': self.miner.is_mining,
                 'configured_difficulty': self.config.difficulty,
                 'total_reward': self.miner.total_reward,
-                'total_transactions': 0,
                 'reward_transactions': self.miner.blocks_mined,
-                'connection_status': 'error',
-                'p2p_connected': False,
-                'p2p_peers': 0,
                 'uptime': time.time() - self.stats['start_time'],
                 'total_mining_attempts': len(self.miner.mining_history),
-                'success_rate': 0,
-                'avg_mining_time': 0,
-                'current_hash_rate': 0,
-                'current_hash': '',
-                'current_nonce': 0,
-                'cuda_available': False,
-                'mining_method': 'CPU',
                 'hash_algorithm': self.hash_algorithm,
                 'error': str(e)
-            }
+            })
+            return status
     
     def mine_single_block(self, miner=None, force_cuda: Optional[bool] = None) -> Tuple[bool, str]:
         """Mine a single block (lunalib 1.8.7 GenesisMiner対応)"""
@@ -2651,7 +2961,7 @@ class LunaNode:
             # lunalib 1.8.7 Miner: mine_block()を使う
             mining_start = time.time()
             result = target_miner.mine_block()
-            safe_print(f"[DEBUG] mine_block() result: {result}")
+            _debug_log.debug("[DEBUG] mine_block() result: %s", result)
             log_cpu_mining_event("mine_block_result", {"result": str(result)})
             success, message, block_data = False, '', None
             if isinstance(result, tuple) and len(result) == 3:
@@ -2666,8 +2976,8 @@ class LunaNode:
                 block_data = result if isinstance(result, dict) else None
             if not success and isinstance(message, str) and "Previous hash mismatch" in message:
                 return False, "Stale block detected (chain advanced)"
-            safe_print(f"[DEBUG] Parsed block_data: {block_data}")
-            safe_print(f"[DEBUG] success: {success}, message: {message}")
+            _debug_log.debug("[DEBUG] Parsed block_data: %s", block_data)
+            _debug_log.debug("[DEBUG] success: %s, message: %s", success, message)
             if success and block_data:
                 log_cpu_mining_event("block_mined", {"block_index": block_data.get('index'), "block_data": block_data})
                 block_index = block_data.get('index', 'unknown')
@@ -2680,8 +2990,8 @@ class LunaNode:
                 block_hash = block_data.get('hash', '')
                 mining_time = time.time() - mining_start
                 tx_count = len(block_data.get('transactions', []))
-                safe_print(f"[DEBUG] Mined block keys: {list(block_data.keys())}")
-                safe_print(f"[DEBUG] nonce: {nonce}, mining_time: {mining_time}, hash: {block_hash}, difficulty: {block_difficulty}")
+                _debug_log.debug("[DEBUG] Mined block keys: %s", list(block_data.keys()))
+                _debug_log.debug("[DEBUG] nonce: %s, mining_time: %s, hash: %s, difficulty: %s", nonce, mining_time, block_hash, block_difficulty)
                 # --- 報酬トランザクションのself-transfer修正を必ず適用 ---
                 fixed_transactions = []
                 miner_addr = self.config.miner_address
@@ -2718,7 +3028,7 @@ class LunaNode:
                     self.stats['cuda_last_nonce'] = nonce
                     self.stats['cuda_last_hash'] = block_hash
                     self.stats['last_mining_method'] = 'cuda'
-                    safe_print(f"[DEBUG] CUDA mining: cuda_hash_rate={self.stats['cuda_hash_rate']}")
+                    _debug_log.debug("[DEBUG] CUDA mining: cuda_hash_rate=%s", self.stats['cuda_hash_rate'])
                     log_mining_debug_event(
                         "cuda_mining_result",
                         {
@@ -2732,13 +3042,13 @@ class LunaNode:
                 else:
                     if hasattr(target_miner, 'get_mining_stats'):
                         mining_stats = target_miner.get_mining_stats()
-                        safe_print(f"[DEBUG] mining_stats: {mining_stats}")
+                        _debug_log.debug("[DEBUG] mining_stats: %s", mining_stats)
                         self.stats['cpu_hash_rate'] = mining_stats.get('hash_rate', 0)
-                        safe_print(f"[DEBUG] CPU mining: cpu_hash_rate={self.stats['cpu_hash_rate']} (lunalib), nonce={nonce}, mining_time={mining_time}")
+                        _debug_log.debug("[DEBUG] CPU mining: cpu_hash_rate=%s (lunalib), nonce=%s, mining_time=%s", self.stats['cpu_hash_rate'], nonce, mining_time)
                     else:
                         if mining_time > 0:
                             self.stats['cpu_hash_rate'] = nonce / mining_time
-                            safe_print(f"[DEBUG] CPU mining: cpu_hash_rate={self.stats['cpu_hash_rate']}, nonce={nonce}, mining_time={mining_time}")
+                            _debug_log.debug("[DEBUG] CPU mining: cpu_hash_rate=%s, nonce=%s, mining_time=%s", self.stats['cpu_hash_rate'], nonce, mining_time)
                     self.stats['last_mining_method'] = 'cpu'
                 submit_success, submit_message = self.submit_block(block_data)
                 log_cpu_mining_event("submit_block_result", {"success": submit_success, "message": submit_message, "block_index": block_data.get('index')})
@@ -2809,6 +3119,7 @@ class LunaNode:
                             self.new_reward_callback(reward_tx)
                         except Exception:
                             pass
+                    self._invalidate_status_cache()
                     if self.history_updated_callback:
                         try:
                             self.history_updated_callback()
@@ -3001,7 +3312,7 @@ class LunaNode:
             if not self._ensure_gpu_miner_ready():
                 if LUNALIB_IMPORT_ERROR:
                     self._log_message(f"GPU miner unavailable (LunaLib import error: {LUNALIB_IMPORT_ERROR})", "error")
-                if getattr(self, "_gpu_init_deferred", False):
+                if self._gpu_init_deferred:
                     self._log_message("GPU miner unavailable (GPU init deferred)", "error")
                 self._log_message("GPU miner unavailable", "error")
                 return False
@@ -3032,7 +3343,7 @@ class LunaNode:
                         "device_name": getattr(getattr(self.gpu_miner, "cuda_manager", None), "device_name", None) if self.gpu_miner else None,
                         "use_gpu": bool(getattr(self.config, "use_gpu", False)),
                         "enable_gpu_mining": bool(getattr(self.config, "enable_gpu_mining", False)),
-                        "gpu_init_deferred": bool(getattr(self, "_gpu_init_deferred", False)),
+                        "gpu_init_deferred": self._gpu_init_deferred,
                         "lunalib_import_error": LUNALIB_IMPORT_ERROR,
                     },
                     scope="cuda",
@@ -3070,7 +3381,7 @@ class LunaNode:
         """Lazy-create GPU miner when GPU init was deferred at startup."""
         if not LunaLibMiner:
             return False
-        if getattr(self, "_gpu_init_deferred", False):
+        if self._gpu_init_deferred:
             try:
                 self._gpu_init_deferred = False
             except Exception:
@@ -3167,6 +3478,7 @@ class LunaNode:
     def stop_auto_mining(self):
         """Stop auto-mining (lunalib 2.4.0仕様: stop_miningのみ)"""
         self._stop_mining_event.set()
+        self._invalidate_status_cache()
         try:
             def _abort_miner(miner_obj):
                 if not miner_obj:
@@ -3208,10 +3520,7 @@ class LunaNode:
         if level > 100:
             level = 100
         self.config.performance_level = level
-        try:
-            self.config.save_to_storage()
-        except Exception:
-            pass
+        self.request_config_save()
         self._log_message(f"Performance level set to {level}%", "info")
     
     def sync_network(self, progress_callback=None) -> Dict:
@@ -3228,11 +3537,15 @@ class LunaNode:
             # Get current status
             if progress_callback:
                 progress_callback(50, "Syncing blockchain status...")
-            status = self.get_status()
+            status = self.get_status(ttl=0)
 
             if progress_callback:
                 progress_callback(65, "Updating blockchain cache...")
-            self.sync_blockchain_cache(progress_callback=progress_callback)
+            # Reuse the height get_status() just polled (if fresh) instead of asking the node again
+            known_height = None
+            if time.time() - self._net_cache_ts < self.net_poll_interval:
+                known_height = self._net_cache.get("height") or None
+            self.sync_blockchain_cache(progress_callback=progress_callback, latest_height=known_height)
             
             # Sync mempool via P2P if available
             if progress_callback:
@@ -3288,8 +3601,32 @@ class LunaNode:
             except Exception:
                 pass
     
+    def _mining_history_signature(self) -> Tuple:
+        """Cheap fingerprint of the history sources (in-memory lengths + file mtime)"""
+        sig = []
+        for miner in (self.miner, self.gpu_miner):
+            history = getattr(miner, "mining_history", None) if miner else None
+            sig.append(len(history) if isinstance(history, list) else -1)
+        try:
+            sig.append(os.path.getmtime(self.data_manager.mining_history_file))
+        except OSError:
+            sig.append(None)
+        return tuple(sig)
+
     def get_mining_history(self) -> List[Dict]:
-        """Get mining history"""
+        """Get mining history (newest first); reuses the last merge while sources are unchanged"""
+        sig = self._mining_history_signature()
+        now = time.monotonic()
+        if self._history_cache is not None and sig == self._history_cache_sig and now - self._history_cache_ts < 10:
+            return list(self._history_cache)
+        merged = self._merge_mining_history()
+        self._history_cache = merged
+        self._history_cache_sig = sig
+        self._history_cache_ts = now
+        return list(merged)
+
+    def _merge_mining_history(self) -> List[Dict]:
+        """Merge, dedupe and sort history from the miners and the history file"""
         records: List[Dict] = []
         try:
             if self.miner and hasattr(self.miner, "get_mining_history"):
@@ -3335,6 +3672,17 @@ class LunaNode:
             merged.sort(key=lambda r: float(r.get("timestamp", 0)), reverse=True)
         except Exception:
             pass
+        # Bound growth: keep every mined block, but only the newest failed attempts
+        if len(merged) > self.MAX_FAILED_HISTORY:
+            kept = []
+            failed = 0
+            for rec in merged:
+                if self._is_success_record(rec):
+                    kept.append(rec)
+                elif failed < self.MAX_FAILED_HISTORY:
+                    kept.append(rec)
+                    failed += 1
+            merged = kept
         return merged
 
     def get_mined_rewards(self) -> List[Dict]:
@@ -3373,7 +3721,7 @@ class LunaNode:
     
     def get_logs(self) -> List[Dict]:
         """Get application logs"""
-        return self.logs
+        return list(self.logs)
     
     def submit_block(self, block_data: Dict) -> Tuple[bool, str]:
         """Submit mined block using LunaLib blockchain manager"""
@@ -3441,14 +3789,13 @@ class LunaNode:
 
                 if latest_height is None or not isinstance(latest_block, dict):
                     try:
-                        import requests
                         node_url = getattr(self.config, "node_url", "https://bank.linglin.art")
-                        height_resp = requests.get(f"{node_url}/blockchain/height", timeout=10)
+                        height_resp = self._http_session.get(f"{node_url}/blockchain/height", timeout=10)
                         if height_resp.ok:
                             height_data = height_resp.json()
                             latest_height = height_data.get("height", latest_height)
                         if latest_height is not None:
-                            latest_resp = requests.get(f"{node_url}/blockchain/block/{int(latest_height)}", timeout=10)
+                            latest_resp = self._http_session.get(f"{node_url}/blockchain/block/{int(latest_height)}", timeout=10)
                             if latest_resp.ok:
                                 latest_data = latest_resp.json()
                                 if isinstance(latest_data, dict) and isinstance(latest_data.get("block"), dict):
@@ -3539,36 +3886,30 @@ class LunaNode:
             except Exception:
                 pass
             
-            # Submit using LunaLib BlockchainManager if available (preferred)
+            # Submit using LunaLib BlockchainManager if available (preferred).
+            # If it is slow to answer, race the plain JSON fallback against it.
             submit_ok, submit_msg = False, ""
+            raced = False
+            primary_outcome = {}
             if self.blockchain_manager and hasattr(self.blockchain_manager, "submit_block"):
-                try:
-                    result = self.blockchain_manager.submit_block(block_data)
-                    if isinstance(result, dict):
-                        submit_ok = bool(result.get("success", False))
-                        submit_msg = result.get("message") or result.get("error") or "Block submitted"
-                    elif isinstance(result, tuple) and len(result) >= 2:
-                        submit_ok = bool(result[0])
-                        submit_msg = str(result[1])
-                    else:
-                        submit_ok = bool(result)
-                        submit_msg = "Block submitted" if submit_ok else "Submission failed"
-                    log_mining_debug_event(
-                        "submit_block_result",
-                        {"ok": submit_ok, "message": submit_msg},
-                        scope="submit",
-                    )
-                except Exception as e:
-                    submit_ok = False
-                    submit_msg = f"LunaLib submit failed: {e}"
-                    log_mining_debug_event(
-                        "submit_block_exception",
-                        {"error": str(e)},
-                        scope="submit",
-                    )
+                primary = self._submit_executor.submit(self._submit_block_lunalib, block_data, primary_outcome)
+                done, _pending = wait([primary], timeout=self._submit_race_delay)
+                if done:
+                    submit_ok, submit_msg = primary.result()
+                else:
+                    raced = True
+                    log_mining_debug_event("submit_race_started", {"delay": self._submit_race_delay}, scope="submit")
+                    fallback = self._submit_executor.submit(self._submit_block_plain_json, block_data)
+                    for future in as_completed([primary, fallback]):
+                        submit_ok, submit_msg = future.result()
+                        if submit_ok:
+                            break
 
-            # Fallback: Submit plain JSON (server rejects gzip payloads)
-            if not submit_ok:
+            # Fallback: Submit plain JSON (server rejects gzip payloads).
+            # A definitive reject from the node would only be repeated, so skip it.
+            if not submit_ok and not raced and primary_outcome.get("rejected"):
+                log_mining_debug_event("submit_rejected_no_fallback", {"message": submit_msg}, scope="submit")
+            elif not submit_ok and not raced:
                 submit_ok, submit_msg = self._submit_block_plain_json(block_data)
             if submit_ok:
                 self._last_submitted_hash = block_data.get("hash")
@@ -3665,18 +4006,13 @@ class LunaNode:
 
     def _confirm_block_by_id(self, block_data: Dict) -> bool:
         """Confirm block on chain via /get_block/{id}."""
-        try:
-            import requests
-        except Exception:
-            return False
-
         try:
             node_url = getattr(self.config, "node_url", "https://bank.linglin.art")
             block_id = block_data.get("index")
             if block_id is None:
                 return False
             url = f"{node_url}/get_block/{block_id}"
-            resp = requests.get(url, timeout=10)
+            resp = self._http_session.get(url, timeout=10)
             if not resp.ok:
                 return False
             data = resp.json()
@@ -3878,7 +4214,7 @@ class LunaNode:
                 if hasattr(self.miner, "_calculate_block_hash"):
                     block_data["hash"] = self.miner._calculate_block_hash(
                         block_data.get("index", 0),
-                        block_data.get("previous_hash", "0" * 64),
+                        block_data.get("previous_hash", _ZERO_HASH),
                         block_data.get("timestamp", time.time()),
                         block_data.get("transactions", []),
                         block_data.get("nonce", 0),
@@ -3888,6 +4224,45 @@ class LunaNode:
         except Exception:
             pass
 
+    def _submit_block_lunalib(self, block_data: Dict, outcome: Optional[Dict] = None) -> Tuple[bool, str]:
+        """Submit through the LunaLib BlockchainManager.
+
+        When ``outcome`` is given, ``outcome["rejected"]`` is set if the node
+        explicitly rejected the block (invalid/stale/etc., see
+        ``_SUBMIT_REJECT_MARKERS``), never for transport or server failures.
+        """
+        try:
+            result = self.blockchain_manager.submit_block(block_data)
+            if isinstance(result, dict):
+                submit_ok = bool(result.get("success", False))
+                submit_msg = result.get("message") or result.get("error") or "Block submitted"
+                if outcome is not None and not submit_ok and result.get("error"):
+                    # Only consensus rejects skip the fallback; transport, timeout,
+                    # 5xx and gzip/encoding failures still get the plain JSON retry
+                    err_text = str(result.get("error")).lower()
+                    if (any(marker in err_text for marker in _SUBMIT_REJECT_MARKERS)
+                            and not any(marker in err_text for marker in _SUBMIT_TRANSPORT_MARKERS)):
+                        outcome["rejected"] = True
+            elif isinstance(result, tuple) and len(result) >= 2:
+                submit_ok = bool(result[0])
+                submit_msg = str(result[1])
+            else:
+                submit_ok = bool(result)
+                submit_msg = "Block submitted" if submit_ok else "Submission failed"
+            log_mining_debug_event(
+                "submit_block_result",
+                {"ok": submit_ok, "message": submit_msg},
+                scope="submit",
+            )
+            return submit_ok, submit_msg
+        except Exception as e:
+            log_mining_debug_event(
+                "submit_block_exception",
+                {"error": str(e)},
+                scope="submit",
+            )
+            return False, f"LunaLib submit failed: {e}"
+
     def _submit_block_plain_json(self, block_data: Dict) -> Tuple[bool, str]:
         """Fallback submission using plain JSON (no gzip)."""
         try:
@@ -3897,17 +4272,22 @@ class LunaNode:
                 {"endpoint": endpoint, "block_index": block_data.get("index"), "hash": block_data.get("hash")},
                 scope="submit",
             )
-            response = requests.post(
+            # Encode once up front (orjson when available) instead of requests' json=
+            body = _dumps_json_bytes(block_data)
+            response = self._http_session.post(
                 endpoint,
-                json=block_data,
+                data=body,
                 headers={"Content-Type": "application/json", "Accept-Encoding": "identity"},
-                timeout=30,
+                timeout=(5, 30),  # fail fast on connect, allow slow block validation
+                stream=True,  # rejection bodies may echo the whole block; read them lazily
             )
             if response.status_code in (200, 201):
                 try:
-                    data = response.json()
+                    data = _loads_json_bytes(response.content)
                 except Exception:
                     data = {}
+                if not isinstance(data, dict):
+                    data = {}
                 message = data.get("message", "Block submitted")
                 skipped = bool(data.get("skipped"))
                 already_exists = "already exists" in (message or "").lower()
@@ -3946,10 +4326,7 @@ class LunaNode:
                     return True, warn_msg
                 self._log_message(f"Block #{block_data.get('index')} submitted", "success")
                 return True, message
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = ""
+            error_text = self._read_submit_error(response)
             log_mining_debug_event(
                 "plain_submit_failed",
                 {"status": response.status_code, "error": error_text},
@@ -3962,16 +4339,41 @@ class LunaNode:
             log_mining_debug_event("plain_submit_exception", {"error": str(e)}, scope="submit")
             return False, f"Plain submit failed: {e}"
     
+    @staticmethod
+    def _read_submit_error(response, limit: int = 4096) -> str:
+        """Rejection reason from at most `limit` bytes of a streamed response"""
+        head = b""
+        try:
+            head = next(response.iter_content(chunk_size=limit), b"")
+        except Exception:
+            pass
+        finally:
+            try:
+                response.close()
+            except Exception:
+                pass
+        try:
+            data = _loads_json_bytes(head)
+            if isinstance(data, dict):
+                reason = data.get("message") or data.get("error")
+                if reason:
+                    return str(reason)
+        except Exception:
+            pass
+        return head.decode("utf-8", errors="replace")[:512]
+
     def _save_block_locally(self, block_data: Dict) -> bool:
         """Save block locally when network submission fails"""
         try:
-            blocks_dir = "./data/blocks"
-            if not os.path.exists(blocks_dir):
-                os.makedirs(blocks_dir)
+            blocks_dir = self._blocks_dir
+            if blocks_dir is None:
+                blocks_dir = os.path.join(".", "data", "blocks")
+                os.makedirs(blocks_dir, exist_ok=True)
+                self._blocks_dir = blocks_dir
             
             block_file = os.path.join(blocks_dir, f"block_{block_data['index']}_{int(time.time())}.json")
-            with open(block_file, 'w') as f:
-                json.dump(block_data, f, indent=2, default=str)
+            with open(block_file, 'wb', buffering=64 * 1024) as f:
+                f.write(_dumps_json_bytes(block_data))
             
             self._log_message(f"Block saved locally: {block_file}", "info")
             return True
@@ -4031,7 +4433,7 @@ class LunaNode:
 
         try:
             with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(cache, f, ensure_ascii=False, indent=2)
+                json.dump(cache, f, ensure_ascii=False, separators=(',', ':'))
         except Exception:
             pass
 
@@ -4096,20 +4498,20 @@ class LunaNode:
 
         try:
             with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(cache, f, ensure_ascii=False, indent=2)
+                json.dump(cache, f, ensure_ascii=False, separators=(',', ':'))
         except Exception:
             pass
     
     def update_wallet_address(self, new_address: str):
         """Update miner wallet address"""
         self.config.miner_address = new_address
-        self.config.save_to_storage()
+        self.request_config_save()
         self._log_message(f"Wallet address updated to: {new_address}", "info")
     
     def update_difficulty(self, new_difficulty: int):
         """Update mining difficulty"""
         self.config.difficulty = new_difficulty
-        self.config.save_to_storage()
+        self.request_config_save()
         
         # Also update the miner's config reference
         if self.miner and hasattr(self.miner, 'config'):
@@ -4119,8 +4521,14 @@ class LunaNode:
     
     def update_node_url(self, new_url: str):
         """Update node URL and reinitialize miner/P2P client"""
+        if new_url == self.config.node_url:
+            return
         self.config.node_url = new_url
-        self.config.save_to_storage()
+        self.request_config_save()
+
+        # Only the network snapshot is endpoint-specific; keep local chain caches
+        self._net_cache_ts = 0.0
+        self._invalidate_status_cache()
         
         # Stop existing P2P client
         if self.p2p_client:
@@ -4157,14 +4565,14 @@ class LunaNode:
     def update_mining_interval(self, new_interval: int):
         """Update mining interval"""
         self.config.mining_interval = new_interval
-        self.config.save_to_storage()
+        self.request_config_save()
         self._log_message(f"Mining interval updated to: {new_interval} seconds", "info")
     
     def toggle_gpu_acceleration(self, enabled: bool):
         """Toggle GPU/CUDA acceleration for mining (lunalib 2.4.0仕様)"""
         self.config.use_gpu = enabled
         self.config.enable_gpu_mining = bool(enabled)
-        self.config.save_to_storage()
+        self.request_config_save()
         if self.miner:
             self.miner.use_cuda = bool(enabled)
             if hasattr(self.miner, "use_cpu"):
@@ -4174,7 +4582,7 @@ class LunaNode:
     def toggle_auto_mining(self, enabled: bool):
         """Toggle auto-mining"""
         self.config.auto_mine = enabled
-        self.config.save_to_storage()
+        self.request_config_save()
         if enabled:
             self.start_auto_mining()
             self._log_message("Auto-mining enabled", "info")
@@ -4201,6 +4609,35 @@ class LunaNode:
             except Exception as e:
                 print(f"[DEBUG] Error stopping P2P client: {e}")
 
+        # Stop sentinel first; if the queue stays full, drop the oldest
+        # pending block so the worker still sees it
+        try:
+            self._submit_q.put(None, timeout=1.0)
+        except queue.Full:
+            try:
+                self._submit_q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._submit_q.put_nowait(None)
+            except queue.Full:
+                pass
+        except Exception:
+            pass
+
+        try:
+            self._submit_executor.shutdown(wait=False)
+        except Exception:
+            pass
+
+        # Final config/log flush
+        try:
+            self._flush_stop_event.set()
+            self._flush_config()
+            self._flush_logs()
+        except Exception:
+            pass
+
     def _resolve_p2p_connected(self) -> bool:
         """Best-effort P2P connection state across lunalib versions."""
         if not self.p2p_client: